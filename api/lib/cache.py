@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Tuple
 CACHE_VERSION = "1.3"
 CACHE_TTL_SECONDS = 60 * 60 * 24 * 30  # 30 days
 COMPLETION_DELAY_MINUTES = 30
+_RECOVERED_BY_RE = re.compile(r"recovered by\s+([a-z]{2,3})", re.IGNORECASE)
 
 
 class RedisClient:
@@ -345,7 +346,7 @@ def build_cache_plays(raw_data: Dict, probability_map: Dict, pregame_probabiliti
             is_interception = (not is_two_point_conversion_attempt) and ("intercept" in event_text_lower)
             is_fumble_turnover = False
             if (not is_two_point_conversion_attempt) and ("fumble" in event_text_lower) and ("recovered by" in event_text_lower):
-                m = re.search(r"recovered by\s+([a-z]{2,3})", event_text_lower, flags=re.IGNORECASE)
+                m = _RECOVERED_BY_RE.search(event_text_lower)
                 recovered_abbr = normalize_abbr(m.group(1), known=known_abbrs) if m else ""
                 offense_abbr = normalize_abbr(drive_team_abbr, known=known_abbrs)
                 if recovered_abbr and offense_abbr:
@@ -14,6 +14,20 @@ _REPLAY_DECISION_RE = re.compile(r"\b(?:reversed|overturned)\b[.:]?\s*", re.IGNO
 _YARDS_FOR_RE = re.compile(r"\bfor (-?\d+) yards\b", re.IGNORECASE)
 _YARDS_LOSS_RE = re.compile(r"\bfor loss of (\d+) yards\b", re.IGNORECASE)
 _RECOVERED_BY_ABBR_RE = re.compile(r"\brecovered by\s+([a-z]{2,4})\b", re.IGNORECASE)
+_AT_SPOT_RE = re.compile(r"\bat\s+([A-Z]{2,3}\s+\d+)\b")
+# Keyword alternations for the play classifiers (plain substring semantics, like `in`).
+_SPIKE_KNEEL_RE = re.compile(r"spike|kneel")
+_NULLIFIED_RE = re.compile(r"nullified|no play")
+# A declined or offsetting penalty never makes the play a penalty play.
+_PENALTY_SETTLED_RE = re.compile(r"declined|offsetting")
+_KICK_RE = re.compile(r"kickoff|punt")
+_SPECIAL_TEAMS_RE = re.compile(r"punt|kickoff|field goal|extra point|xp|fg|onside")
+_PASS_HINT_RE = re.compile(r"pass|sack|scramble")
+# 'run' plus the common rush direction phrases
+_RUSH_TEXT_RE = re.compile(
+    r"run|up the middle|left end|right end|left tackle|right tackle|left guard|right guard|middle for"
+    r"|around left|around right"
+)
 _TEAM_ABBR_ALIASES = {
     # ESPN play text can use older abbreviations than the boxscore/team metadata.
     "was": "wsh",
@@ -78,14 +92,17 @@ def _credited_yards_before_fumble(event_text):
     return None
 
 
-def classify_total_offense_play(play):
+def classify_total_offense_play(play, text_lower=None, type_lower=None):
     """
     Classify plays for ESPN-style total offense (Total Yards) reconciliation.
 
     Compared to `classify_offense_play`, this includes kneels/spikes as offense plays.
+    Callers that already lowercased the play's text and type can pass them in.
     """
-    text_lower = play.get('text', '').lower()
-    type_lower = play.get('type', {}).get('text', 'unknown').lower()
+    if text_lower is None:
+        text_lower = play.get('text', '').lower()
+    if type_lower is None:
+        type_lower = play.get('type', {}).get('text', 'unknown').lower()
 
     if is_nullified_play(text_lower):
         return False, False, False
@@ -95,25 +112,14 @@ def classify_total_offense_play(play):
         return False, False, False
 
     # Kickoff/punt returns are special teams plays, not offensive plays.
-    if ('kickoff' in text_lower or 'kickoff' in type_lower) and 'return' in type_lower:
-        return False, False, False
-    if ('punt' in text_lower or 'punt' in type_lower) and 'return' in type_lower:
+    if 'return' in type_lower and _KICK_RE.search(f"{text_lower}\n{type_lower}"):
         return False, False, False
 
     # Spikes/kneels should count toward total offense.
     if is_spike_or_kneel(text_lower, type_lower):
         return True, 'kneel' in text_lower or 'kneel' in type_lower, 'spike' in text_lower or 'spike' in type_lower
 
-    pass_hint = (any_stat_contains(play, ['pass', 'sack']) or
-                 'pass' in type_lower or 'sack' in type_lower or
-                 'scramble' in type_lower or 'pass' in text_lower or
-                 'sack' in text_lower or 'scramble' in text_lower)
-
-    rush_patterns = ['up the middle', 'left end', 'right end', 'left tackle',
-                     'right tackle', 'left guard', 'right guard', 'middle for',
-                     'around left', 'around right']
-    rush_hint = (any_stat_contains(play, ['rush']) or 'rush' in type_lower or
-                 'run' in text_lower or any(p in text_lower for p in rush_patterns))
+    rush_hint, pass_hint = _offense_hints(play, text_lower, type_lower)
 
     # Aborted snaps are counted as rush attempts in official stats.
     if 'aborted' in text_lower and 'fumble' in text_lower:
@@ -177,6 +183,10 @@ def yardline_to_coord(pos_text, team_abbr):
     return 100 - yard
 
 
+# Share of the yards to go a play must gain to count as a success, by down.
+_SUCCESS_FRACTION_BY_DOWN = {1: 0.4, 2: 0.6, 3: 1.0, 4: 1.0}
+
+
 def calculate_success(down, distance, yards_gained):
     """
     Determine if a play was 'successful' based on standard analytics definition:
@@ -184,13 +194,8 @@ def calculate_success(down, distance, yards_gained):
     - 2nd Down: Gained >= 60% of yards to go
     - 3rd/4th Down: Gained 100% of yards to go (converted)
     """
-    if down == 1:
-        return yards_gained >= (0.4 * distance)
-    elif down == 2:
-        return yards_gained >= (0.6 * distance)
-    elif down in [3, 4]:
-        return yards_gained >= distance
-    return False
+    frac = _SUCCESS_FRACTION_BY_DOWN.get(down)
+    return frac is not None and yards_gained >= frac * distance
 
 
 def any_stat_contains(play, needles):
@@ -205,28 +210,37 @@ def any_stat_contains(play, needles):
     return False
 
 
+def _offense_hints(play, text_lower, type_lower):
+    """
+    Return the raw (rush_hint, pass_hint) for a play from its stats, type and text.
+    The play's stat labels are lowered and joined once and each hint is one regex scan,
+    instead of an any_stat_contains walk per needle list plus a chain of `in` tests.
+    """
+    labels = []
+    for stat in play.get('statistics', []):
+        stat_type = stat.get('type', {})
+        labels.append(str(stat_type.get('abbreviation', '')).lower())
+        labels.append(str(stat_type.get('text', '')).lower())
+    stat_labels = "\n".join(labels)
+
+    # No keyword contains the separator, so one scan over text+type equals scanning each.
+    pass_hint = bool('pass' in stat_labels or 'sack' in stat_labels or
+                     _PASS_HINT_RE.search(f"{text_lower}\n{type_lower}"))
+    rush_hint = bool('rush' in stat_labels or 'rush' in type_lower or _RUSH_TEXT_RE.search(text_lower))
+    return rush_hint, pass_hint
+
+
 def is_penalty_play(play, text_lower, type_lower):
     """Detect if a play is a penalty play that should be excluded from stats."""
-    if 'declined' in text_lower:
-        return False
-    if 'offsetting' in text_lower:
+    if _PENALTY_SETTLED_RE.search(text_lower) or 'no play' not in text_lower:
         return False
-    if play.get('penalty') and 'no play' in text_lower:
-        return True
-    if play.get('hasPenalty') and 'no play' in text_lower:
-        return True
-    if 'no play' in text_lower and ('penalty' in text_lower or 'penalty' in type_lower):
-        return True
-    return False
+    return bool(play.get('penalty') or play.get('hasPenalty') or
+                'penalty' in text_lower or 'penalty' in type_lower)
 
 
 def is_spike_or_kneel(text_lower, type_lower):
     """Detect clock-management plays (spikes, QB kneels)."""
-    if 'spike' in text_lower or 'spike' in type_lower:
-        return True
-    if 'kneel' in text_lower or 'kneel' in type_lower or 'qb kneel' in text_lower:
-        return True
-    return False
+    return bool(_SPIKE_KNEEL_RE.search(text_lower) or _SPIKE_KNEEL_RE.search(type_lower))
 
 
 def is_special_teams_play(text_lower, type_lower):
@@ -236,13 +250,12 @@ def is_special_teams_play(text_lower, type_lower):
     """
     if 'touchdown' in text_lower or 'touchdown' in type_lower:
         return False
-    st_keywords = ['punt', 'kickoff', 'field goal', 'extra point', 'xp', 'fg', 'onside']
-    return any(k in text_lower or k in type_lower for k in st_keywords)
+    return bool(_SPECIAL_TEAMS_RE.search(text_lower) or _SPECIAL_TEAMS_RE.search(type_lower))
 
 
 def is_nullified_play(text_lower):
     """Detect plays that didn't happen (nullified, no play)."""
-    return 'nullified' in text_lower or 'no play' in text_lower
+    return _NULLIFIED_RE.search(text_lower) is not None
 
 
 def is_declined_only_penalty(text_lower, penalty_info):
@@ -270,13 +283,16 @@ def is_declined_only_penalty(text_lower, penalty_info):
     return True
 
 
-def classify_offense_play(play):
+def classify_offense_play(play, text_lower=None, type_lower=None):
     """
     Decide if a play should count toward offensive SR/YPP/explosives.
     Returns (is_offense_play, is_run, is_pass) where scrambles/sacks are treated as pass.
+    Callers that already lowercased the play's text and type can pass them in.
     """
-    text_lower = play.get('text', '').lower()
-    type_lower = play.get('type', {}).get('text', 'unknown').lower()
+    if text_lower is None:
+        text_lower = play.get('text', '').lower()
+    if type_lower is None:
+        type_lower = play.get('type', {}).get('text', 'unknown').lower()
 
     if is_nullified_play(text_lower):
         return False, False, False
@@ -288,22 +304,10 @@ def classify_offense_play(play):
         return False, False, False
 
     # Kickoff/punt return TDs are special teams plays, not offensive plays
-    if ('kickoff' in text_lower or 'kickoff' in type_lower) and 'return' in type_lower:
+    if 'return' in type_lower and _KICK_RE.search(f"{text_lower}\n{type_lower}"):
         return False, False, False
-    if ('punt' in text_lower or 'punt' in type_lower) and 'return' in type_lower:
-        return False, False, False
-
-    pass_hint = (any_stat_contains(play, ['pass', 'sack']) or
-                 'pass' in type_lower or 'sack' in type_lower or
-                 'scramble' in type_lower or 'pass' in text_lower or
-                 'sack' in text_lower or 'scramble' in text_lower)
 
-    # Detect rushing plays - include common rush direction phrases
-    rush_patterns = ['up the middle', 'left end', 'right end', 'left tackle',
-                     'right tackle', 'left guard', 'right guard', 'middle for',
-                     'around left', 'around right']
-    rush_hint = (any_stat_contains(play, ['rush']) or 'rush' in type_lower or
-                 'run' in text_lower or any(p in text_lower for p in rush_patterns))
+    rush_hint, pass_hint = _offense_hints(play, text_lower, type_lower)
 
     # Scrambles should be treated as pass dropbacks, not runs
     if pass_hint and rush_hint and ('scramble' in text_lower or 'scramble' in type_lower):
@@ -458,6 +462,12 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
         if tid and abbr:
             id_to_abbr[tid] = abbr
     abbr_to_id = {abbr.lower(): tid for tid, abbr in id_to_abbr.items()}
+    id_to_abbr_lower = {tid: abbr.lower() for tid, abbr in id_to_abbr.items()}
+    # With exactly two teams, each team id maps to the other's; the drive loop looks this up per play.
+    opponent_of = {}
+    if len(id_to_abbr) == 2:
+        first_id, second_id = id_to_abbr
+        opponent_of = {first_id: second_id, second_id: first_id}
 
     scoring_map = {}
     non_offensive_play_map = {}
@@ -466,15 +476,6 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
     if scoring_plays:
         prev_home = 0
         prev_away = 0
-        comps = game_data.get('header', {}).get('competitions', [])
-        home_id = away_id = None
-        if comps:
-            for comp in comps[0].get('competitors', []):
-                if comp.get('homeAway') == 'home':
-                    home_id = comp.get('id')
-                elif comp.get('homeAway') == 'away':
-                    away_id = comp.get('id')
-
         for sp in scoring_plays:
             h = sp.get('homeScore', 0)
             a = sp.get('awayScore', 0)
@@ -628,7 +629,7 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
             return pos_text.strip()
         down_dist = end.get('downDistanceText')
         if isinstance(down_dist, str):
-            m = re.search(r"\bat\s+([A-Z]{2,3}\s+\d+)\b", down_dist)
+            m = _AT_SPOT_RE.search(down_dist)
             if m:
                 return m.group(1)
         return None
@@ -672,18 +673,17 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
         for play in drive_plays:
             text = play.get('text', '')
             text_lower = text.lower()
-            event_text = final_play_text(text)
-            event_text_lower = event_text.lower()
-            has_replay_reversal = event_text != text
             play_type = play.get('type', {}).get('text', 'Unknown')
             play_type_lower = play_type.lower()
-            start_team_id = play.get('start', {}).get('team', {}).get('id') or team_id
-            end_team_id = play.get('end', {}).get('team', {}).get('id')
+            # Bound once per play; the start/end dicts are read throughout the accounting below.
+            play_start = play.get('start', {})
+            play_end = play.get('end', {})
+            explicit_start_team_id = play_start.get('team', {}).get('id')
+            start_team_id = explicit_start_team_id or team_id
+            end_team_id = play_end.get('team', {}).get('id')
             team_abbrev = play.get('team', {}).get('abbreviation', '').lower()
-            offense_abbrev = team_abbrev or id_to_abbr.get(team_id, '').lower()
-            opponent_id = None
-            if len(id_to_abbr) == 2 and start_team_id in id_to_abbr:
-                opponent_id = next((tid for tid in id_to_abbr if tid != start_team_id), None)
+            offense_abbrev = team_abbrev or id_to_abbr_lower.get(team_id, '')
+            opponent_id = opponent_of.get(start_team_id)
 
             competitive = is_competitive_play(play, probability_map, wp_threshold, prev_home_wp, prev_away_wp)
             probability_snapshot = lookup_probability_with_delta(play)
@@ -691,7 +691,7 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
             if not drive_first_play_checked:
                 drive_first_play_checked = True
                 drive_started_competitive = competitive
-                start_yte = play.get('start', {}).get('yardsToEndzone', -1)
+                start_yte = play_start.get('yardsToEndzone', -1)
                 if start_yte == -1:
                     start_yte = drive.get('start', {}).get('yardsToEndzone', -1)
                 if start_yte != -1:
@@ -743,15 +743,27 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                 continue
             last_competitive_play = play
             last_competitive_prob = probability_snapshot
+            # Replay-aware text is only needed past the skip filters above.
+            event_text = final_play_text(text)
+            event_text_lower = event_text.lower()
+            has_replay_reversal = event_text != text
+
+            # Per-play facts shared by the drive-trip check and the yardage accounting below.
+            is_offense, is_run, is_pass = classify_offense_play(play, text_lower, play_type_lower)
+            penalty_type_slug = (penalty_info.get('type') or {}).get('slug')
+            penalty_status_slug = (penalty_info.get('status') or {}).get('slug')
+            is_intentional_grounding = (
+                penalty_status_slug == 'accepted'
+                and penalty_type_slug == 'intentional-grounding'
+            ) or ('intentional grounding' in text_lower)
 
             if competitive and drive_started_competitive:
-                is_offense_play, _, _ = classify_offense_play(play)
-                if is_offense_play:
+                if is_offense:
                     drive_has_offensive_play = True
                 if play.get('scoringPlay') and 'field goal' in play_type_lower:
                     drive_has_offensive_play = True
-                if is_offense_play and not drive_crossed_40_competitive:
-                    yte_start = play.get('start', {}).get('yardsToEndzone')
+                if is_offense and not drive_crossed_40_competitive:
+                    yte_start = play_start.get('yardsToEndzone')
                     gained = play.get('statYardage')
                     if isinstance(yte_start, (int, float)):
                         current_yte_est = yte_start
@@ -801,7 +813,7 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                 punt_in_air = 'punts' in event_text_lower
                 if punt_in_air and opponent_id and (fumble_phrase or muffed_kick):
                     current_possessor = opponent_id
-                    current_off_abbr = id_to_abbr.get(opponent_id, '').lower()
+                    current_off_abbr = id_to_abbr_lower.get(opponent_id, '')
 
                 # Onside kick - if the kicking team recovers, charge the receiving team (drive team)
                 # with a turnover. On kickoffs, ESPN drives typically attribute the drive to the
@@ -809,7 +821,6 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                 onside_kick = 'onside' in event_text_lower and 'kick' in event_text_lower
                 kicking_team_recovered_onside = False
                 if onside_kick:
-                    explicit_start_team_id = play.get('start', {}).get('team', {}).get('id')
                     kicking_team_recovered_onside = (
                         end_team_id is not None
                         and end_team_id != team_id
@@ -821,7 +832,7 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
 
                 if muffed_kick and opponent_id:
                     current_possessor = opponent_id
-                    current_off_abbr = id_to_abbr.get(opponent_id, '').lower()
+                    current_off_abbr = id_to_abbr_lower.get(opponent_id, '')
 
                 # Kickoff return fumbles are charged to the receiving team (opponent), even though
                 # `start_team_id` is the kicking team. Without this adjustment, a successful
@@ -829,13 +840,13 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                 kickoff_play = 'kickoff' in play_type_lower or 'kickoff' in event_text_lower
                 if kickoff_play and fumble_phrase and opponent_id and not onside_kick and not muffed_kick:
                     current_possessor = opponent_id
-                    current_off_abbr = id_to_abbr.get(opponent_id, '').lower()
+                    current_off_abbr = id_to_abbr_lower.get(opponent_id, '')
 
                 if interception:
                     turnover_events.append((current_possessor, 'interception'))
                     if opponent_id:
                         current_possessor = opponent_id
-                        current_off_abbr = id_to_abbr.get(opponent_id, '').lower()
+                        current_off_abbr = id_to_abbr_lower.get(opponent_id, '')
 
                 if fumble_phrase:
                     recovered_team_id = None
@@ -918,17 +929,9 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                     })
 
             # Offensive stats
-            is_offense, is_run, is_pass = classify_offense_play(play)
             if is_offense and (is_run or is_pass):
                 stats[team_id]['Plays'] += 1
                 yards = play.get('statYardage', 0)
-
-                penalty_type_slug = (penalty_info.get('type') or {}).get('slug')
-                penalty_status_slug = (penalty_info.get('status') or {}).get('slug')
-                is_intentional_grounding = (
-                    penalty_status_slug == 'accepted'
-                    and penalty_type_slug == 'intentional-grounding'
-                ) or ('intentional grounding' in text_lower)
                 if is_intentional_grounding:
                     yards = 0
 
@@ -943,8 +946,8 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                     if credited is not None:
                         yards = credited
 
-                down = play.get('start', {}).get('down', 1)
-                dist = play.get('start', {}).get('distance', 10)
+                down = play_start.get('down', 1)
+                dist = play_start.get('distance', 10)
 
                 stats[team_id]['Offensive Yards'] += yards
 
@@ -965,16 +968,9 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                         })
 
             # Total offense (ESPN-style): include kneels/spikes, and use credited yards for fumbles.
-            is_total_offense, _, _ = classify_total_offense_play(play)
+            is_total_offense, _, _ = classify_total_offense_play(play, text_lower, play_type_lower)
             if is_total_offense:
                 total_yards = play.get('statYardage', 0)
-
-                penalty_type_slug = (penalty_info.get('type') or {}).get('slug')
-                penalty_status_slug = (penalty_info.get('status') or {}).get('slug')
-                is_intentional_grounding = (
-                    penalty_status_slug == 'accepted'
-                    and penalty_type_slug == 'intentional-grounding'
-                ) or ('intentional grounding' in text_lower)
                 if is_intentional_grounding:
                     total_yards = 0
 
@@ -990,8 +986,7 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                 # Accepted penalties: derive credited offensive yards from the enforcement spot when possible.
                 # This avoids counting the penalty yardage in total offense, while also protecting against
                 # ESPN payloads where statYardage is inconsistent with the described enforcement.
-                penalty_status_slug = (penalty_info.get('status') or {}).get('slug')
-                start_yte = (play.get('start') or {}).get('yardsToEndzone')
+                start_yte = play_start.get('yardsToEndzone')
                 if (
                     penalty_status_slug == 'accepted'
                     and isinstance(start_yte, (int, float))
@@ -999,9 +994,11 @@ def process_game_stats(game_data, expanded=False, probability_map=None,
                     and not interception
                     and not fumble_phrase
                 ):
-                    start_team_id = ((play.get('start') or {}).get('team') or {}).get('id')
-                    end_team_id = ((play.get('end') or {}).get('team') or {}).get('id')
-                    if start_team_id is None or end_team_id is None or start_team_id == end_team_id:
+                    if (
+                        explicit_start_team_id is None
+                        or end_team_id is None
+                        or explicit_start_team_id == end_team_id
+                    ):
                         enforced_yte = _enforced_at_yards_to_endzone(event_text, offense_abbrev)
                         if enforced_yte is not None:
                             credited = int(start_yte - enforced_yte)
@@ -16,19 +16,29 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import csv
+import functools
 import json
 import os
 import sys
-import textwrap
 import urllib.error
 import urllib.request
 import gzip
-from dataclasses import dataclass
+import heapq
+import io
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 import re
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback for environments without orjson
+    orjson = None
+
 
 REPO_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(REPO_ROOT / "api"))
@@ -65,11 +75,24 @@ def _decompress_response(data: bytes) -> bytes:
     return data
 
 
+def _json_loads(data: Union[bytes, str]) -> Any:
+    # orjson (when installed) parses bytes directly; its JSONDecodeError subclasses json.JSONDecodeError.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
 def _fetch_json(url: str, *, timeout_s: int = 15) -> Dict[str, Any]:
     req = urllib.request.Request(url, headers=ESPN_REQUEST_HEADERS)
     with urllib.request.urlopen(req, timeout=timeout_s) as resp:
         raw = _decompress_response(resp.read())
-        return json.loads(raw.decode())
+        return _json_loads(raw)
 
 
 def _parse_int(value: Any) -> Optional[int]:
@@ -79,6 +102,13 @@ def _parse_int(value: Any) -> Optional[int]:
         return None
 
 
+def _parse_int_fast(value: Any) -> Optional[int]:
+    # Hot path for play `statYardage`, which ESPN almost always sends as an int already.
+    if type(value) is int:
+        return value
+    return _parse_int(value)
+
+
 def load_game_ids(path: Path) -> List[str]:
     ids: List[str] = []
     for raw in path.read_text().splitlines():
@@ -160,6 +190,9 @@ def write_game_ids_txt(path: Path, game_ids: Sequence[str]) -> None:
     path.write_text("\n".join(game_ids) + ("\n" if game_ids else ""))
 
 
+_ESPN_TEAM_STAT_NAMES = frozenset({"totalYards", "turnovers", "totalPenaltiesYards"})
+
+
 def extract_espn_official_team_stats(
     raw_data: Dict[str, Any],
 ) -> Tuple[Dict[str, Dict[str, Optional[int]]], Dict[str, str]]:
@@ -181,13 +214,19 @@ def extract_espn_official_team_stats(
         abbr = (team_data.get("team", {}) or {}).get("abbreviation")
         if not abbr:
             continue
-        stats = {s.get("name"): s.get("displayValue") for s in (team_data.get("statistics") or [])}
+        # Only three of the ~25 boxscore stats are needed. The whole list is still scanned so a
+        # repeated stat name keeps its last value.
+        stats: Dict[str, Any] = {}
+        for stat in (team_data.get("statistics") or []):
+            name = stat.get("name")
+            if name in _ESPN_TEAM_STAT_NAMES:
+                stats[name] = stat.get("displayValue")
         penalty_yards = None
         penalties_raw = stats.get("totalPenaltiesYards")
-        if isinstance(penalties_raw, str) and "-" in penalties_raw:
-            parts = penalties_raw.split("-", 1)
-            if len(parts) == 2:
-                penalty_yards = _parse_int(parts[1])
+        if isinstance(penalties_raw, str):
+            _count, sep, yards = penalties_raw.partition("-")
+            if sep:
+                penalty_yards = _parse_int(yards)
         espn_by_abbr[abbr] = {
             "Score": away_score if abbr == away_abbr else home_score,
             "Total Yards": _parse_int(stats.get("totalYards")),
@@ -199,16 +238,38 @@ def extract_espn_official_team_stats(
     return espn_by_abbr, meta
 
 
+def _cached_payload_path(cache_dir: Path, game_id: str) -> Optional[Path]:
+    # Plain JSON (shared with the other cache readers) wins over the optional gzip variant.
+    for name in (f"{game_id}.json", f"{game_id}.json.gz"):
+        path = cache_dir / name
+        if path.exists():
+            return path
+    return None
+
+
+def _read_cached_payload(path: Path) -> Dict[str, Any]:
+    return _json_loads(_decompress_response(path.read_bytes()))
+
+
+def _write_cached_payload(cache_dir: Path, game_id: str, raw_data: Dict[str, Any], *, gzip_level: Optional[int]) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    payload = _json_dumps_bytes(raw_data)
+    if gzip_level is None:
+        (cache_dir / f"{game_id}.json").write_bytes(payload)
+    else:
+        (cache_dir / f"{game_id}.json.gz").write_bytes(gzip.compress(payload, compresslevel=gzip_level))
+
+
 def load_raw_game_data(game_id: str, *, source: str, cache_dir: Path) -> Tuple[Dict[str, Any], str]:
     if source not in {"auto", "cache", "network"}:
         raise ValueError(f"Invalid source: {source}")
 
-    cache_path = cache_dir / f"{game_id}.json"
-    if source in {"auto", "cache"} and cache_path.exists():
-        return json.loads(cache_path.read_text()), "cache"
+    cache_path = _cached_payload_path(cache_dir, game_id)
+    if source in {"auto", "cache"} and cache_path is not None:
+        return _read_cached_payload(cache_path), "cache"
 
     if source == "cache":
-        raise FileNotFoundError(f"Missing cached game JSON: {cache_path}")
+        raise FileNotFoundError(f"Missing cached game JSON: {cache_dir / f'{game_id}.json'}")
 
     return get_game_data(game_id), "network"
 
@@ -231,8 +292,7 @@ class TeamLine:
     windelta_source: str
 
 
-@dataclass(frozen=True)
-class PlayBlurb:
+class PlayBlurb(NamedTuple):
     quarter: Any
     clock: str
     play_type: str
@@ -259,18 +319,23 @@ class GameRecon:
     potential_turnover_keyword_plays: Dict[str, List[PlayBlurb]]
     excluded_yardage_plays: Dict[str, List[PlayBlurb]]
     total_yards_corrections_by_team: Dict[str, List[str]]
+    # boxscore team id <-> abbreviation, computed once per game in build_season_recon.
+    id_to_abbr: Dict[str, str] = field(default_factory=dict)
+    abbr_to_id: Dict[str, str] = field(default_factory=dict)
 
-    @property
+    # Derived values are read by the priority sort and by every writer; cache them on the instance
+    # (cached_property stores into __dict__ directly, which frozen dataclasses allow).
+    @functools.cached_property
     def max_abs_turnovers_delta(self) -> int:
         vals = [abs(l.turnovers_delta or 0) for l in self.team_lines]
         return max(vals) if vals else 0
 
-    @property
+    @functools.cached_property
     def max_abs_yards_delta(self) -> int:
         vals = [abs(l.yards_delta or 0) for l in self.team_lines]
         return max(vals) if vals else 0
 
-    @property
+    @functools.cached_property
     def any_mismatch(self) -> bool:
         return any(
             (l.yards_delta or 0) != 0 or (l.turnovers_delta or 0) != 0 or (l.penalty_yards_delta or 0) != 0
@@ -299,22 +364,37 @@ def compute_aggregate_deltas(recon: Sequence[GameRecon]) -> Dict[str, Dict[str,
     Aggregate totals across all team rows and compute overall percent deltas:
       pct_delta = (sum(windelta) - sum(espn)) / sum(espn) * 100
     """
-    lines: List[TeamLine] = []
+    # Single pass over team rows; each stat is (espn_sum, windelta_sum, rows_used, mismatch_rows).
+    y_e = y_w = y_used = y_mm = 0
+    t_e = t_w = t_used = t_mm = 0
+    p_e = p_w = p_used = p_mm = 0
     for g in recon:
-        lines.extend(list(g.team_lines))
-
-    def agg(field_espn: str, field_windelta: str) -> Dict[str, Optional[Number]]:
-        espn_sum = 0
-        windelta_sum = 0
-        used = 0
-        for line in lines:
-            e = getattr(line, field_espn)
-            w = getattr(line, field_windelta)
-            if e is None or w is None:
-                continue
-            espn_sum += int(e)
-            windelta_sum += int(w)
-            used += 1
+        for line in g.team_lines:
+            e, w = line.espn_total_yards, line.windelta_total_yards
+            if e is not None and w is not None:
+                y_e += int(e)
+                y_w += int(w)
+                y_used += 1
+            if line.yards_delta:
+                y_mm += 1
+
+            e, w = line.espn_turnovers, line.windelta_turnovers
+            if e is not None and w is not None:
+                t_e += int(e)
+                t_w += int(w)
+                t_used += 1
+            if line.turnovers_delta:
+                t_mm += 1
+
+            e, w = line.espn_penalty_yards, line.windelta_penalty_yards
+            if e is not None and w is not None:
+                p_e += int(e)
+                p_w += int(w)
+                p_used += 1
+            if line.penalty_yards_delta:
+                p_mm += 1
+
+    def agg(espn_sum: int, windelta_sum: int, used: int, mismatch_rows: int) -> Dict[str, Optional[Number]]:
         delta = windelta_sum - espn_sum
         return {
             "rows_used": used,
@@ -322,24 +402,13 @@ def compute_aggregate_deltas(recon: Sequence[GameRecon]) -> Dict[str, Dict[str,
             "windelta_sum": windelta_sum,
             "delta": delta,
             "pct_delta": _pct_delta(delta, espn_sum),
+            "mismatch_rows": mismatch_rows,
         }
 
-    def mismatch_count(field_delta: str) -> int:
-        return sum(1 for line in lines if (getattr(line, field_delta) or 0) != 0)
-
     return {
-        "total_yards": {
-            **agg("espn_total_yards", "windelta_total_yards"),
-            "mismatch_rows": mismatch_count("yards_delta"),
-        },
-        "turnovers": {
-            **agg("espn_turnovers", "windelta_turnovers"),
-            "mismatch_rows": mismatch_count("turnovers_delta"),
-        },
-        "penalty_yards": {
-            **agg("espn_penalty_yards", "windelta_penalty_yards"),
-            "mismatch_rows": mismatch_count("penalty_yards_delta"),
-        },
+        "total_yards": agg(y_e, y_w, y_used, y_mm),
+        "turnovers": agg(t_e, t_w, t_used, t_mm),
+        "penalty_yards": agg(p_e, p_w, p_used, p_mm),
     }
 
 
@@ -364,9 +433,21 @@ def print_aggregate_report(recon: Sequence[GameRecon]) -> None:
     print(line("Penalty Yards", "penalty_yards"))
 
 
-_FOR_YARDS_RE = re.compile(r"\bfor (-?\d+) yards\b", re.IGNORECASE)
+# One scan over the fumble prefix: group 1 = "for N yards", group 2 = "for loss of N yards",
+# no group = "for no gain/loss".
+_CREDITED_YARDS_RE = re.compile(
+    r"\bfor (?:(-?\d+) yards\b|loss of (\d+) yards\b|no (?:gain|loss))", re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _final_text_lower(text: str) -> str:
+    # Pure over the play text; the same text is normalized by clue analysis, tracked-turnover keys,
+    # and again when residual analysis re-flattens cached games.
+    return final_play_text(text).strip().lower()
 
 
+@functools.lru_cache(maxsize=100_000)
 def _credited_yards_before_fumble(event_text: str) -> Optional[int]:
     if not event_text:
         return None
@@ -374,23 +455,96 @@ def _credited_yards_before_fumble(event_text: str) -> Optional[int]:
     if "fumble" not in lower:
         return None
     prefix = lower.split("fumble", 1)[0]
-    matches = list(_FOR_YARDS_RE.finditer(prefix))
-    if matches:
-        try:
-            return int(matches[-1].group(1))
-        except ValueError:
-            return None
-    if "for no gain" in prefix or "for no loss" in prefix:
+
+    # Fast path: the canonical "... for N yards" is usually the last "for" phrase before the fumble.
+    idx = prefix.rfind("for ")
+    if idx != -1 and (idx == 0 or not prefix[idx - 1].isalnum()):
+        num, _, rest = prefix[idx + 4 :].partition(" ")
+        digits = num[1:] if num[:1] == "-" else num
+        if digits.isascii() and digits.isdigit() and rest[:5] == "yards" and not rest[5:6].isalnum():
+            return int(num)
+
+    # Precedence: last "for N yards", then "for no gain/loss", then first "for loss of N yards".
+    last_yards: Optional[str] = None
+    first_loss: Optional[str] = None
+    no_gain = False
+    for m in _CREDITED_YARDS_RE.finditer(prefix):
+        if m.group(1) is not None:
+            last_yards = m.group(1)
+        elif m.group(2) is not None:
+            if first_loss is None:
+                first_loss = m.group(2)
+        else:
+            no_gain = True
+    if last_yards is not None:
+        return int(last_yards)
+    if no_gain:
         return 0
-    m = re.search(r"\bfor loss of (\d+) yards\b", prefix)
-    if m:
-        try:
-            return -int(m.group(1))
-        except ValueError:
-            return None
+    if first_loss is not None:
+        return -int(first_loss)
     return None
 
 
+class _PlayRow(NamedTuple):
+    """Per-play fields pre-extracted once from `drives.previous[*].plays[*]`."""
+
+    drive_team_id: str
+    quarter: Any
+    clock: str
+    type_lower: str
+    text: str
+    text_final_lower: str
+    stat_yards: Optional[int]
+    play: Dict[str, Any]
+
+
+def _flatten_plays(raw_data: Dict[str, Any]) -> List[_PlayRow]:
+    rows: List[_PlayRow] = []
+    for drive in (raw_data.get("drives", {}) or {}).get("previous", []) or []:
+        drive_team_id = str(((drive.get("team") or {}).get("id") or "")).strip()
+        for play in (drive.get("plays") or []):
+            text = play.get("text") or ""
+            rows.append(
+                _PlayRow(
+                    drive_team_id=drive_team_id,
+                    quarter=(play.get("period") or {}).get("number"),
+                    clock=((play.get("clock") or {}).get("displayValue") or ""),
+                    type_lower=((play.get("type") or {}).get("text") or "").lower(),
+                    text=text,
+                    text_final_lower=_final_text_lower(text),
+                    stat_yards=_parse_int_fast(play.get("statYardage")),
+                    play=play,
+                )
+            )
+    return rows
+
+
+def _residual_from_rows(rows: Sequence[_PlayRow], team_id: str) -> Tuple[int, int]:
+    """
+    Sum the two residual yard sources for one team's plays:
+      - kneel/spike statYardage (excluded from windelta totals)
+      - fumble credited-yards adjustment (credited - statYardage)
+    """
+    kneel_sum = 0
+    fumble_adj = 0
+    for row in rows:
+        if row.drive_team_id != team_id:
+            continue
+        stat_yards = row.stat_yards or 0
+
+        if is_spike_or_kneel(row.text.lower(), row.type_lower):
+            kneel_sum += stat_yards
+
+        # Only fumble plays yield a credited value, so no separate "fumble" check is needed.
+        credited = _credited_yards_before_fumble(row.text_final_lower)
+        if credited is not None:
+            fumble_adj += credited - stat_yards
+    return kneel_sum, fumble_adj
+
+
+_RECOMMENDATION_ROW_FMT = "- {gid} {team}: YdsΔ {yd} TOΔ {to} PenYdsΔ {py}\n"
+
+
 def write_logic_recommendations(
     path: Path,
     recon: Sequence[GameRecon],
@@ -405,14 +559,6 @@ def write_logic_recommendations(
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: List[TeamLine] = []
-    for g in recon:
-        lines.extend(list(g.team_lines))
-
-    mismatch_lines = [
-        l for l in lines if (l.yards_delta or 0) != 0 or (l.turnovers_delta or 0) != 0 or (l.penalty_yards_delta or 0) != 0
-    ]
-
     agg = compute_aggregate_deltas(recon)
 
     # Heuristic residual-analysis on remaining yard deltas.
@@ -420,128 +566,109 @@ def write_logic_recommendations(
     fumble_credit_explained = 0
     analyzed = 0
 
-    # Build quick map: game_id -> raw payload.
-    raw_by_game: Dict[str, Dict[str, Any]] = {}
+    # Only games with a yards mismatch are walked. Group those rows per game so each cached payload is
+    # parsed, team-resolved and flattened once (and released before the next game).
+    yard_mismatch_lines: List[TeamLine] = []
     for g in recon:
-        cache_path = cache_dir / f"{g.game_id}.json"
-        if not cache_path.exists():
+        game_yard_lines = [l for l in g.team_lines if l.yards_delta]
+        if not game_yard_lines:
+            continue
+        yard_mismatch_lines.extend(game_yard_lines)
+
+        cache_path = _cached_payload_path(cache_dir, g.game_id)
+        if cache_path is None:
             continue
         try:
-            raw_by_game[g.game_id] = json.loads(cache_path.read_text())
+            raw = _read_cached_payload(cache_path)
         except Exception:
             continue
-
-    # Precompute team ids per game.
-    abbr_to_id_by_game: Dict[str, Dict[str, str]] = {}
-    for gid, raw in raw_by_game.items():
-        abbr_to_id: Dict[str, str] = {}
-        for t in (raw.get("boxscore", {}) or {}).get("teams", []) or []:
-            abbr = (t.get("team", {}) or {}).get("abbreviation")
-            tid = (t.get("team", {}) or {}).get("id")
-            if abbr and tid:
-                abbr_to_id[abbr] = str(tid)
-        abbr_to_id_by_game[gid] = abbr_to_id
-
-    for l in mismatch_lines:
-        if (l.yards_delta or 0) == 0:
-            continue
-        raw = raw_by_game.get(l.game_id)
         if not raw:
             continue
-        team_id = abbr_to_id_by_game.get(l.game_id, {}).get(l.team)
-        if not team_id:
-            continue
 
-        drives = (raw.get("drives", {}) or {}).get("previous", []) or []
-        kneel_sum = 0
-        fumble_adj = 0
-
-        for drive in drives:
-            if str(((drive.get("team") or {}).get("id") or "")) != team_id:
+        abbr_to_id = g.abbr_to_id or _team_id_maps(raw)[1]
+        rows = _flatten_plays(raw)
+        for l in game_yard_lines:
+            team_id = abbr_to_id.get(l.team)
+            if not team_id:
                 continue
-            for play in (drive.get("plays") or []):
-                text = play.get("text") or ""
-                text_lower = text.lower()
-                play_type = ((play.get("type") or {}).get("text") or "").lower()
-                stat_yards = _parse_int(play.get("statYardage")) or 0
-
-                if is_spike_or_kneel(text_lower, play_type):
-                    kneel_sum += stat_yards
-
-                event_text = final_play_text(text) or ""
-                credited = _credited_yards_before_fumble(event_text)
-                if credited is not None and "fumble" in (event_text or "").lower():
-                    fumble_adj += (credited - stat_yards)
-
-        analyzed += 1
-        if (l.yards_delta or 0) == -kneel_sum:
-            kneel_explained += 1
-        if (l.yards_delta or 0) == fumble_adj:
-            fumble_credit_explained += 1
+            kneel_sum, fumble_adj = _residual_from_rows(rows, team_id)
 
-    # Top remaining mismatches for human review.
-    top_yards = sorted([l for l in mismatch_lines if (l.yards_delta or 0) != 0], key=lambda x: abs(x.yards_delta or 0), reverse=True)[:25]
-    top_turnovers = sorted([l for l in mismatch_lines if (l.turnovers_delta or 0) != 0], key=lambda x: abs(x.turnovers_delta or 0), reverse=True)[:25]
+            analyzed += 1
+            if l.yards_delta == -kneel_sum:
+                kneel_explained += 1
+            if l.yards_delta == fumble_adj:
+                fumble_credit_explained += 1
 
-    out: List[str] = []
-    out.append(f"# Season {season} Logic Recommendations (Auto)")
-    out.append("")
-    out.append("Generated from cached `pbp_cache/*.json` plus `audits/season_*_team_comparison.csv`-equivalent data.")
-    out.append("")
-    out.append("## Aggregate Percent Deltas")
-    out.append("- Percent deltas are computed as `(sum(windelta) - sum(espn)) / sum(espn) * 100`.")
+    # Top remaining mismatches for human review.
+    top_yards = heapq.nlargest(25, yard_mismatch_lines, key=lambda x: abs(x.yards_delta or 0))
+    top_turnovers = heapq.nlargest(
+        25, (l for g in recon for l in g.team_lines if l.turnovers_delta), key=lambda x: abs(x.turnovers_delta or 0)
+    )
 
     def fmt_pct(val: Optional[Number]) -> str:
         if val is None:
             return "N/A"
         return f"{float(val):+.3f}%"
 
-    out.append(f"- Total Yards: {fmt_pct(agg['total_yards']['pct_delta'])} (Δ {int(agg['total_yards']['delta']):+d})")
-    out.append(f"- Turnovers: {fmt_pct(agg['turnovers']['pct_delta'])} (Δ {int(agg['turnovers']['delta']):+d})")
-    out.append(f"- Penalty Yards: {fmt_pct(agg['penalty_yards']['pct_delta'])} (Δ {int(agg['penalty_yards']['delta']):+d})")
-    out.append("")
-    out.append("## Remaining Mismatch Counts (Team Rows)")
-    out.append(f"- Yards mismatches: {agg['total_yards']['mismatch_rows']}/{agg['total_yards']['rows_used']}")  # type: ignore[index]
-    out.append(f"- Turnover mismatches: {agg['turnovers']['mismatch_rows']}/{agg['turnovers']['rows_used']}")  # type: ignore[index]
-    out.append(f"- Penalty-yards mismatches: {agg['penalty_yards']['mismatch_rows']}/{agg['penalty_yards']['rows_used']}")  # type: ignore[index]
-    out.append("")
-
-    out.append("## Heuristic Attribution (Yards)")
-    out.append(f"- Rows analyzed (with cache available): {analyzed}")
-    out.append(f"- Rows exactly explained by kneel/spike exclusion: {kneel_explained}")
-    out.append(f"- Rows exactly explained by fumble credited-yards mismatch: {fumble_credit_explained}")
-    out.append("")
-
-    out.append("## Recommendations")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Season {season} Logic Recommendations (Auto)\n\n")
+    w("Generated from cached `pbp_cache/*.json` plus `audits/season_*_team_comparison.csv`-equivalent data.\n\n")
+    w("## Aggregate Percent Deltas\n")
+    w("- Percent deltas are computed as `(sum(windelta) - sum(espn)) / sum(espn) * 100`.\n")
+    w(f"- Total Yards: {fmt_pct(agg['total_yards']['pct_delta'])} (Δ {int(agg['total_yards']['delta']):+d})\n")
+    w(f"- Turnovers: {fmt_pct(agg['turnovers']['pct_delta'])} (Δ {int(agg['turnovers']['delta']):+d})\n")
+    w(f"- Penalty Yards: {fmt_pct(agg['penalty_yards']['pct_delta'])} (Δ {int(agg['penalty_yards']['delta']):+d})\n\n")
+    w("## Remaining Mismatch Counts (Team Rows)\n")
+    w(f"- Yards mismatches: {agg['total_yards']['mismatch_rows']}/{agg['total_yards']['rows_used']}\n")  # type: ignore[index]
+    w(f"- Turnover mismatches: {agg['turnovers']['mismatch_rows']}/{agg['turnovers']['rows_used']}\n")  # type: ignore[index]
+    w(f"- Penalty-yards mismatches: {agg['penalty_yards']['mismatch_rows']}/{agg['penalty_yards']['rows_used']}\n\n")  # type: ignore[index]
+
+    w("## Heuristic Attribution (Yards)\n")
+    w(f"- Rows analyzed (with cache available): {analyzed}\n")
+    w(f"- Rows exactly explained by kneel/spike exclusion: {kneel_explained}\n")
+    w(f"- Rows exactly explained by fumble credited-yards mismatch: {fumble_credit_explained}\n\n")
+
+    w("## Recommendations\n")
     if agg["total_yards"]["mismatch_rows"]:
-        out.append("- Inspect top remaining yards deltas; remaining issues are likely edge cases (special teams attribution, rare replay phrasing, unusual play types).")
+        w("- Inspect top remaining yards deltas; remaining issues are likely edge cases (special teams attribution, rare replay phrasing, unusual play types).\n")
     if agg["turnovers"]["mismatch_rows"]:
-        out.append("- Inspect turnover mismatches; remaining issues are likely muffed-kick or touchback corner cases.")
+        w("- Inspect turnover mismatches; remaining issues are likely muffed-kick or touchback corner cases.\n")
     if not agg["total_yards"]["mismatch_rows"] and not agg["turnovers"]["mismatch_rows"]:
-        out.append("- Core reconciliation looks clean for the compared stats; add new stat categories to extend coverage.")
-    out.append("")
-
-    def fmt_row(l: TeamLine) -> str:
-        return (
-            f"- {l.game_id} {l.team}: YdsΔ {_fmt_delta(l.yards_delta)} "
-            f"TOΔ {_fmt_delta(l.turnovers_delta)} PenYdsΔ {_fmt_delta(l.penalty_yards_delta)}"
-        )
+        w("- Core reconciliation looks clean for the compared stats; add new stat categories to extend coverage.\n")
+    w("\n")
+
+    def write_rows(rows: Sequence[TeamLine]) -> None:
+        fmt = _RECOMMENDATION_ROW_FMT.format
+        for l in rows:
+            w(
+                fmt(
+                    gid=l.game_id,
+                    team=l.team,
+                    yd=_fmt_delta(l.yards_delta),
+                    to=_fmt_delta(l.turnovers_delta),
+                    py=_fmt_delta(l.penalty_yards_delta),
+                )
+            )
 
     if top_yards:
-        out.append("## Top Remaining Yard Deltas (Team Rows)")
-        out.extend(fmt_row(l) for l in top_yards)
-        out.append("")
+        w("## Top Remaining Yard Deltas (Team Rows)\n")
+        write_rows(top_yards)
+        w("\n")
 
     if top_turnovers:
-        out.append("## Remaining Turnover Deltas (Team Rows)")
-        out.extend(fmt_row(l) for l in top_turnovers)
-        out.append("")
+        w("## Remaining Turnover Deltas (Team Rows)\n")
+        write_rows(top_turnovers)
+        w("\n")
+
+    w("## Suggested Deep-Dive Command\n")
+    w("- For any game above: `python diagnose_game_discrepancies.py <game_id>`\n")
 
-    out.append("## Suggested Deep-Dive Command")
-    out.append("- For any game above: `python diagnose_game_discrepancies.py <game_id>`")
-    out.append("")
+    path.write_text(buf.getvalue().rstrip() + "\n")
 
-    path.write_text("\n".join(out).rstrip() + "\n")
+
+# Substring match (no word boundaries), same as the `k in text` checks it replaces.
+_TURNOVER_KEYWORD_RE = re.compile("interception|intercept|fumble|muffed|blocked|onside")
 
 
 def _team_id_maps(raw_data: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, str]]:
@@ -582,7 +709,7 @@ def _build_play_blurb(play: Dict[str, Any], *, reason: Optional[str] = None) ->
         clock=((play.get("clock") or {}).get("displayValue") or ""),
         play_type=((play.get("type") or {}).get("text") or "Unknown"),
         text=(play.get("text") or ""),
-        yards=_parse_int(play.get("statYardage")),
+        yards=_parse_int_fast(play.get("statYardage")),
         reason=reason,
     )
 
@@ -590,12 +717,13 @@ def _build_play_blurb(play: Dict[str, Any], *, reason: Optional[str] = None) ->
 def analyze_reconciliation_clues(
     raw_data: Dict[str, Any],
     details: Dict[str, Any],
+    *,
+    id_to_abbr: Optional[Dict[str, str]] = None,
 ) -> Tuple[Dict[str, List[PlayBlurb]], Dict[str, List[PlayBlurb]], Dict[str, List[PlayBlurb]], Dict[str, List[str]]]:
-    id_to_abbr, _abbr_to_id = _team_id_maps(raw_data)
-    drives = (raw_data.get("drives", {}) or {}).get("previous", []) or []
+    if id_to_abbr is None:
+        id_to_abbr, _abbr_to_id = _team_id_maps(raw_data)
 
     team_abbrs = sorted(set(id_to_abbr.values()))
-    turnover_keywords = ("interception", "intercept", "fumble", "muffed", "blocked", "onside")
 
     # 1) Windelta turnover plays (from expanded details)
     turnover_plays_by_team: Dict[str, List[PlayBlurb]] = {abbr: [] for abbr in team_abbrs}
@@ -605,7 +733,7 @@ def analyze_reconciliation_clues(
         if not abbr:
             continue
         for to_play in (cats or {}).get("Turnovers", []) or []:
-            turnover_plays_by_team.setdefault(abbr, []).append(
+            turnover_plays_by_team[abbr].append(
                 PlayBlurb(
                     quarter=to_play.get("quarter"),
                     clock=to_play.get("clock") or "",
@@ -623,7 +751,7 @@ def analyze_reconciliation_clues(
             stat_yards = corr.get("statYardage")
             corrected = corr.get("correctedYards")
             text = corr.get("text") or ""
-            total_yards_corrections_by_team.setdefault(abbr, []).append(
+            total_yards_corrections_by_team[abbr].append(
                 f"- Q{quarter or '?'} {clock} {play_type}: TotalYards {stat_yards!s} -> {corrected!s}: {text}"
             )
 
@@ -631,53 +759,46 @@ def analyze_reconciliation_clues(
     tracked_keys = set()
     for plays in turnover_plays_by_team.values():
         for p in plays:
-            tracked_keys.add((p.quarter, p.clock, final_play_text(p.text).strip().lower()))
+            tracked_keys.add((p.quarter, p.clock, _final_text_lower(p.text)))
 
     # 2) Potential turnover keyword plays not counted by windelta
     potential_turnover_keyword_plays: Dict[str, List[PlayBlurb]] = {abbr: [] for abbr in team_abbrs}
     # 3) Excluded non-zero yardage plays (classification mismatch candidates)
     excluded_yardage_plays: Dict[str, List[PlayBlurb]] = {abbr: [] for abbr in team_abbrs}
 
-    opponent_id_by_team: Dict[str, Optional[str]] = {}
+    # Resolve drive team -> (abbr, opponent abbr) once per game instead of per play.
+    opponent_abbr_by_team_id: Dict[str, str] = {}
     if len(id_to_abbr) == 2:
-        tids = list(id_to_abbr.keys())
-        opponent_id_by_team[tids[0]] = tids[1]
-        opponent_id_by_team[tids[1]] = tids[0]
+        (tid0, abbr0), (tid1, abbr1) = id_to_abbr.items()
+        opponent_abbr_by_team_id = {tid0: abbr1, tid1: abbr0}
 
-    for drive in drives:
-        drive_team_id = str(((drive.get("team") or {}).get("id") or "")).strip()
-        drive_team_abbr = id_to_abbr.get(drive_team_id, "")
-        opponent_id = opponent_id_by_team.get(drive_team_id)
-        opponent_abbr = id_to_abbr.get(opponent_id, "") if opponent_id else ""
+    for row in _flatten_plays(raw_data):
+        drive_team_abbr = id_to_abbr.get(row.drive_team_id, "")
+        opponent_abbr = opponent_abbr_by_team_id.get(row.drive_team_id, "")
+        type_lower = row.type_lower
+        text_final_lower = row.text_final_lower
 
-        for play in (drive.get("plays") or []):
-            text = play.get("text") or ""
-            text_final_lower = final_play_text(text).strip().lower()
-            type_text = ((play.get("type") or {}).get("text") or "")
-            type_lower = type_text.lower()
+        # Attribute return plays to the receiving team (opponent) when it's clear.
+        play_abbr = drive_team_abbr
+        if ("kickoff" in type_lower or "punt" in type_lower) and "return" in type_lower and opponent_abbr:
+            play_abbr = opponent_abbr
 
-            # Attribute return plays to the receiving team (opponent) when it's clear.
-            play_abbr = drive_team_abbr
-            if ("kickoff" in type_lower or "punt" in type_lower) and "return" in type_lower and opponent_abbr:
-                play_abbr = opponent_abbr
+        if not play_abbr:
+            continue
 
-            if not play_abbr:
-                continue
+        # Potential missed turnovers: keyword plays not in windelta's counted turnover list.
+        if _TURNOVER_KEYWORD_RE.search(text_final_lower) or _TURNOVER_KEYWORD_RE.search(type_lower):
+            key = (row.quarter, row.clock, text_final_lower)
+            if key not in tracked_keys:
+                potential_turnover_keyword_plays[play_abbr].append(_build_play_blurb(row.play))
 
-            # Potential missed turnovers: keyword plays not in windelta's counted turnover list.
-            if any(k in text_final_lower for k in turnover_keywords) or any(k in type_lower for k in turnover_keywords):
-                key = ((play.get("period") or {}).get("number"), ((play.get("clock") or {}).get("displayValue") or ""), text_final_lower)
-                if key not in tracked_keys:
-                    potential_turnover_keyword_plays.setdefault(play_abbr, []).append(_build_play_blurb(play))
-
-            # Excluded plays with non-zero yards: useful for yards reconciliation.
-            yards = _parse_int(play.get("statYardage")) or 0
-            if yards != 0:
-                is_offense, is_run, is_pass = classify_offense_play(play)
-                if not (is_offense and (is_run or is_pass)):
-                    reason = _detect_exclusion_reason(play)
-                    if reason and reason != "marker":
-                        excluded_yardage_plays.setdefault(play_abbr, []).append(_build_play_blurb(play, reason=reason))
+        # Excluded plays with non-zero yards: useful for yards reconciliation.
+        if row.stat_yards:
+            is_offense, is_run, is_pass = classify_offense_play(row.play)
+            if not (is_offense and (is_run or is_pass)):
+                reason = _detect_exclusion_reason(row.play)
+                if reason and reason != "marker":
+                    excluded_yardage_plays[play_abbr].append(_build_play_blurb(row.play, reason=reason))
 
     # Keep output focused: sort by quarter/clock as strings.
     def sort_key(p: PlayBlurb) -> Tuple[int, str]:
@@ -686,7 +807,7 @@ def analyze_reconciliation_clues(
 
     for d in (turnover_plays_by_team, potential_turnover_keyword_plays, excluded_yardage_plays):
         for abbr in list(d.keys()):
-            d[abbr] = sorted(d[abbr], key=sort_key)[:25]
+            d[abbr] = heapq.nsmallest(25, d[abbr], key=sort_key)
 
     for abbr in list(total_yards_corrections_by_team.keys()):
         total_yards_corrections_by_team[abbr] = total_yards_corrections_by_team[abbr][:25]
@@ -699,6 +820,118 @@ def analyze_reconciliation_clues(
     )
 
 
+def load_espn_stats_cache(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        cache = _json_loads(path.read_bytes())
+    except Exception:
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_espn_stats_cache(path: Path, cache: Dict[str, Any]) -> None:
+    """Persist compactly via a temp file + rename so an interrupted run never leaves a truncated cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(_json_dumps_bytes(cache))
+    os.replace(tmp_path, path)
+
+
+def _build_game_recon(
+    game_id: str,
+    *,
+    source: str,
+    cache_dir: Path,
+    cache_write: bool,
+    espn_stats_cache: Dict[str, Any],
+    cache_gzip: bool,
+    espn_stats_written: Optional[Set[str]] = None,
+) -> GameRecon:
+    raw_data, raw_source = load_raw_game_data(game_id, source=source, cache_dir=cache_dir)
+    if raw_source == "network" and cache_write:
+        _write_cached_payload(cache_dir, game_id, raw_data, gzip_level=1 if cache_gzip else None)
+
+    cached = espn_stats_cache.get(game_id)
+    if isinstance(cached, dict) and isinstance(cached.get("espn_stats"), dict) and isinstance(cached.get("meta"), dict):
+        espn_stats = cached["espn_stats"]
+        meta = cached["meta"]
+    else:
+        espn_stats, meta = extract_espn_official_team_stats(raw_data)
+        espn_stats_cache[game_id] = {"espn_stats": espn_stats, "meta": meta}
+        if espn_stats_written is not None:
+            espn_stats_written.add(game_id)
+    away = meta.get("away") or ""
+    home = meta.get("home") or ""
+    if not (away and home):
+        raise ValueError("Missing away/home team abbreviations in payload")
+
+    stats_rows, details = process_game_stats(
+        raw_data,
+        expanded=True,
+        probability_map=None,
+        pregame_probabilities=None,
+        wp_threshold=1.0,
+    )
+    windelta_stats: Dict[str, Dict[str, Optional[int]]] = {
+        row.get("Team"): {
+            "Total Yards": _parse_int(row.get("Total Yards")),
+            "Turnovers": _parse_int(row.get("Turnovers")),
+            "Penalty Yards": _parse_int(row.get("Penalty Yards")),
+        }
+        for row in stats_rows
+        if row.get("Team")
+    }
+
+    def team_line(team: str, home_away: str, opponent: str) -> TeamLine:
+        e = espn_stats.get(team, {})
+        w = windelta_stats.get(team, {})
+        e_y = e.get("Total Yards")
+        w_y = w.get("Total Yards")
+        e_to = e.get("Turnovers")
+        w_to = w.get("Turnovers")
+        e_py = e.get("Penalty Yards")
+        w_py = w.get("Penalty Yards")
+        return TeamLine(
+            game_id=game_id,
+            team=team,
+            home_away=home_away,
+            opponent=opponent,
+            espn_total_yards=e_y,
+            windelta_total_yards=w_y,
+            yards_delta=(w_y - e_y) if (w_y is not None and e_y is not None) else None,
+            espn_turnovers=e_to,
+            windelta_turnovers=w_to,
+            turnovers_delta=(w_to - e_to) if (w_to is not None and e_to is not None) else None,
+            espn_penalty_yards=e_py,
+            windelta_penalty_yards=w_py,
+            penalty_yards_delta=(w_py - e_py) if (w_py is not None and e_py is not None) else None,
+            windelta_source=f"nfl_core.process_game_stats (full, wp_threshold=1.0, raw={raw_source})",
+        )
+
+    away_line = team_line(away, "away", home)
+    home_line = team_line(home, "home", away)
+
+    id_to_abbr, abbr_to_id = _team_id_maps(raw_data)
+    turnover_plays_by_team, potential_keyword, excluded_yards, total_yards_corrections = analyze_reconciliation_clues(
+        raw_data, details, id_to_abbr=id_to_abbr
+    )
+
+    return GameRecon(
+        game_id=game_id,
+        away=away,
+        home=home,
+        raw_source=raw_source,
+        team_lines=(away_line, home_line),
+        turnover_plays_by_team=turnover_plays_by_team,
+        potential_turnover_keyword_plays=potential_keyword,
+        excluded_yardage_plays=excluded_yards,
+        total_yards_corrections_by_team=total_yards_corrections,
+        id_to_abbr=id_to_abbr,
+        abbr_to_id=abbr_to_id,
+    )
+
+
 def build_season_recon(
     game_ids: Iterable[str],
     *,
@@ -706,163 +939,139 @@ def build_season_recon(
     cache_dir: Path,
     cache_write: bool,
     espn_stats_cache: Optional[Dict[str, Any]] = None,
+    cache_gzip: bool = False,
+    max_workers: int = 8,
+    espn_stats_written: Optional[Set[str]] = None,
 ) -> Tuple[List[GameRecon], List[str]]:
+    """
+    Build per-game reconciliation rows. Games are processed on a thread pool so network fetches overlap;
+    results (and failures) keep the input order. With source="cache" nothing is fetched, and the
+    JSON parsing is GIL-bound, so games run sequentially regardless of `max_workers`.
+    Ids whose `espn_stats_cache` entry was added or replaced are collected in `espn_stats_written`.
+    """
     recon: List[GameRecon] = []
     failures: List[str] = []
     if espn_stats_cache is None:
         espn_stats_cache = {}
 
-    for game_id in game_ids:
+    def run(game_id: str) -> Tuple[Optional[GameRecon], Optional[str]]:
         try:
-            raw_data, raw_source = load_raw_game_data(game_id, source=source, cache_dir=cache_dir)
-            if raw_source == "network" and cache_write:
-                cache_dir.mkdir(parents=True, exist_ok=True)
-                (cache_dir / f"{game_id}.json").write_text(json.dumps(raw_data))
-
-            cached = espn_stats_cache.get(game_id)
-            if isinstance(cached, dict) and isinstance(cached.get("espn_stats"), dict) and isinstance(cached.get("meta"), dict):
-                espn_stats = cached["espn_stats"]
-                meta = cached["meta"]
-            else:
-                espn_stats, meta = extract_espn_official_team_stats(raw_data)
-                espn_stats_cache[game_id] = {"espn_stats": espn_stats, "meta": meta}
-            away = meta.get("away") or ""
-            home = meta.get("home") or ""
-            if not (away and home):
-                raise ValueError("Missing away/home team abbreviations in payload")
-
-            stats_rows, details = process_game_stats(
-                raw_data,
-                expanded=True,
-                probability_map=None,
-                pregame_probabilities=None,
-                wp_threshold=1.0,
+            return (
+                _build_game_recon(
+                    game_id,
+                    source=source,
+                    cache_dir=cache_dir,
+                    cache_write=cache_write,
+                    espn_stats_cache=espn_stats_cache,
+                    cache_gzip=cache_gzip,
+                    espn_stats_written=espn_stats_written,
+                ),
+                None,
             )
-            windelta_stats: Dict[str, Dict[str, Optional[int]]] = {
-                row.get("Team"): {
-                    "Total Yards": _parse_int(row.get("Total Yards")),
-                    "Turnovers": _parse_int(row.get("Turnovers")),
-                    "Penalty Yards": _parse_int(row.get("Penalty Yards")),
-                }
-                for row in stats_rows
-                if row.get("Team")
-            }
-
-            def team_line(team: str, home_away: str, opponent: str) -> TeamLine:
-                e = espn_stats.get(team, {})
-                w = windelta_stats.get(team, {})
-                e_y = e.get("Total Yards")
-                w_y = w.get("Total Yards")
-                e_to = e.get("Turnovers")
-                w_to = w.get("Turnovers")
-                e_py = e.get("Penalty Yards")
-                w_py = w.get("Penalty Yards")
-                return TeamLine(
-                    game_id=game_id,
-                    team=team,
-                    home_away=home_away,
-                    opponent=opponent,
-                    espn_total_yards=e_y,
-                    windelta_total_yards=w_y,
-                    yards_delta=(w_y - e_y) if (w_y is not None and e_y is not None) else None,
-                    espn_turnovers=e_to,
-                    windelta_turnovers=w_to,
-                    turnovers_delta=(w_to - e_to) if (w_to is not None and e_to is not None) else None,
-                    espn_penalty_yards=e_py,
-                    windelta_penalty_yards=w_py,
-                    penalty_yards_delta=(w_py - e_py) if (w_py is not None and e_py is not None) else None,
-                    windelta_source=f"nfl_core.process_game_stats (full, wp_threshold=1.0, raw={raw_source})",
-                )
+        except Exception as exc:
+            return None, f"{game_id}: {exc}"
 
-            away_line = team_line(away, "away", home)
-            home_line = team_line(home, "home", away)
+    if source == "cache":
+        max_workers = 1
 
-            turnover_plays_by_team, potential_keyword, excluded_yards, total_yards_corrections = analyze_reconciliation_clues(
-                raw_data, details
-            )
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run, game_ids))
+    else:
+        results = [run(game_id) for game_id in game_ids]
 
-            recon.append(
-                GameRecon(
-                    game_id=game_id,
-                    away=away,
-                    home=home,
-                    raw_source=raw_source,
-                    team_lines=(away_line, home_line),
-                    turnover_plays_by_team=turnover_plays_by_team,
-                    potential_turnover_keyword_plays=potential_keyword,
-                    excluded_yardage_plays=excluded_yards,
-                    total_yards_corrections_by_team=total_yards_corrections,
-                )
-            )
-        except Exception as exc:
-            failures.append(f"{game_id}: {exc}")
+    for game_recon, failure in results:
+        if game_recon is not None:
+            recon.append(game_recon)
+        if failure is not None:
+            failures.append(failure)
 
     return recon, failures
 
 
+# Report writers emit many short rows/lines; a larger buffer keeps write() syscalls rare.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _TrailingWhitespaceTrimmer:
+    """Write-through wrapper that holds back trailing whitespace so the file ends with exactly one newline."""
+
+    def __init__(self, f: Any) -> None:
+        self._f = f
+        self._pending = ""
+
+    def write(self, text: str) -> None:
+        stripped = text.rstrip()
+        if not stripped:
+            self._pending += text
+            return
+        if self._pending:
+            self._f.write(self._pending)
+        self._f.write(stripped)
+        self._pending = text[len(stripped):]
+
+    def finish(self) -> None:
+        self._f.write("\n")
+
+
+# Team CSV columns match TeamLine attribute names, so one attrgetter pulls a whole row.
+TEAM_CSV_FIELDS: Tuple[str, ...] = (
+    "game_id",
+    "team",
+    "home_away",
+    "opponent",
+    "espn_total_yards",
+    "windelta_total_yards",
+    "yards_delta",
+    "espn_turnovers",
+    "windelta_turnovers",
+    "turnovers_delta",
+    "espn_penalty_yards",
+    "windelta_penalty_yards",
+    "penalty_yards_delta",
+    "windelta_source",
+)
+_team_csv_row = operator.attrgetter(*TEAM_CSV_FIELDS)
+
+GAME_PRIORITY_CSV_FIELDS: Tuple[str, ...] = (
+    "game_id",
+    "away",
+    "home",
+    "max_abs_turnovers_delta",
+    "max_abs_yards_delta",
+    "raw_source",
+    "status",
+)
+
+
 def write_team_csv(path: Path, recon: Sequence[GameRecon]) -> None:
+    """Write one row per team line, in the order given (main passes priority-sorted recon)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    rows: List[Dict[str, Any]] = []
-    for g in recon:
-        for line in g.team_lines:
-            rows.append(
-                {
-                    "game_id": line.game_id,
-                    "team": line.team,
-                    "home_away": line.home_away,
-                    "opponent": line.opponent,
-                    "espn_total_yards": line.espn_total_yards,
-                    "windelta_total_yards": line.windelta_total_yards,
-                    "yards_delta": line.yards_delta,
-                    "espn_turnovers": line.espn_turnovers,
-                    "windelta_turnovers": line.windelta_turnovers,
-                    "turnovers_delta": line.turnovers_delta,
-                    "espn_penalty_yards": line.espn_penalty_yards,
-                    "windelta_penalty_yards": line.windelta_penalty_yards,
-                    "penalty_yards_delta": line.penalty_yards_delta,
-                    "windelta_source": line.windelta_source,
-                }
-            )
 
-    # Avoid importing csv in hot paths; output is small enough for JSON->CSV style.
-    import csv
-
-    with path.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else [])
-        if rows:
-            writer.writeheader()
-            writer.writerows(rows)
+    with path.open("w", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(TEAM_CSV_FIELDS)
+        writer.writerows(_team_csv_row(line) for g in recon for line in g.team_lines)
 
 
 def write_game_priority_csv(path: Path, recon: Sequence[GameRecon]) -> None:
+    """Write one row per game; `recon` must already be sorted by `GameRecon.priority_key()`."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    import csv
-
-    with path.open("w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "game_id",
-                "away",
-                "home",
-                "max_abs_turnovers_delta",
-                "max_abs_yards_delta",
-                "raw_source",
-                "status",
-            ],
-        )
-        writer.writeheader()
-        for g in sorted(recon, key=lambda x: x.priority_key()):
+
+    with path.open("w", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(GAME_PRIORITY_CSV_FIELDS)
+        for g in recon:
             writer.writerow(
-                {
-                    "game_id": g.game_id,
-                    "away": g.away,
-                    "home": g.home,
-                    "max_abs_turnovers_delta": g.max_abs_turnovers_delta,
-                    "max_abs_yards_delta": g.max_abs_yards_delta,
-                    "raw_source": g.raw_source,
-                    "status": "MISMATCH" if g.any_mismatch else "MATCH",
-                }
+                (
+                    g.game_id,
+                    g.away,
+                    g.home,
+                    g.max_abs_turnovers_delta,
+                    g.max_abs_yards_delta,
+                    g.raw_source,
+                    "MISMATCH" if g.any_mismatch else "MATCH",
+                )
             )
 
 
@@ -874,125 +1083,139 @@ def _fmt_delta(delta: Optional[int]) -> str:
     return "N/A" if delta is None else f"{delta:+d}"
 
 
+_EMPTY: Tuple[Any, ...] = ()
+_MARKDOWN_TEAM_ROW_FMT = "| {team} | {ey} | {wy} | {yd} | {eto} | {wto} | {tod} | {epy} | {wpy} | {pyd} |\n"
+
+
 def write_markdown_report(path: Path, recon: Sequence[GameRecon], failures: Sequence[str], *, season: int) -> None:
+    """Write the reconciliation report; `recon` must already be sorted by `GameRecon.priority_key()`."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    mismatches = [g for g in recon if g.any_mismatch]
-    mismatch_turnovers = [g for g in mismatches if g.max_abs_turnovers_delta != 0]
-    mismatch_yards = [g for g in mismatches if g.max_abs_yards_delta != 0]
-    mismatch_penalties = [
-        g for g in mismatches if any((l.penalty_yards_delta or 0) != 0 for l in g.team_lines)
-    ]
-
-    # Heuristic "issue buckets"
+    # Partition and count heuristic "issue buckets" in one pass; most games match, so skip them first.
     turnover_keyword_hits = 0
     excluded_yardage_hits = 0
-    for g in mismatches:
-        for plays in g.potential_turnover_keyword_plays.values():
-            turnover_keyword_hits += len(plays)
-        for plays in g.excluded_yardage_plays.values():
-            excluded_yardage_hits += len(plays)
-
-    lines: List[str] = []
-    lines.append(f"# Season {season} Reconciliation Report")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append(f"- Games analyzed: {len(recon)}")
-    lines.append(f"- Mismatch games: {len(mismatches)}")
-    lines.append(f"- Games with turnover mismatches: {len(mismatch_turnovers)}")
-    lines.append(f"- Games with yards mismatches: {len(mismatch_yards)}")
-    lines.append(f"- Games with penalty-yards mismatches: {len(mismatch_penalties)}")
-    if failures:
-        lines.append(f"- Fetch/process failures: {len(failures)}")
-    lines.append("")
-    lines.append("## Priority Sort")
-    lines.append("Sorted by `max(|turnovers_delta|) desc`, then `max(|yards_delta|) desc` per game.")
-    lines.append("")
-    lines.append("## Suggested Reconciliation Work Items (Heuristic)")
-    lines.append(
-        "- Turnover deltas: review turnover classification (muffed kicks, onside recoveries, replay reversals)."
-    )
-    lines.append(
-        "- Yards deltas: review how yards are attributed on turnover plays (interceptions/fumbles with returns) vs offensive yards."
-    )
-    lines.append("- Penalty deltas: review how penalties are attributed (defensive/offensive, accepted vs no-play).")
-    lines.append(
-        "- Excluded plays with non-zero yards can indicate classification mismatches (penalty/no-play, special teams returns)."
-    )
-    lines.append("")
-    lines.append("Heuristic counts across mismatch games:")
-    lines.append(f"- Potential missed turnover-keyword plays (not counted by windelta): {turnover_keyword_hits}")
-    lines.append(f"- Excluded non-zero-yard plays (not counted as offense by windelta): {excluded_yardage_hits}")
-    lines.append("")
-
-    lines.append("## Games (Prioritized)")
-    for g in sorted(recon, key=lambda x: x.priority_key()):
-        away_line, home_line = g.team_lines
+    mismatches: List[GameRecon] = []
+    mismatch_turnovers: List[GameRecon] = []
+    mismatch_yards: List[GameRecon] = []
+    mismatch_penalties: List[GameRecon] = []
+    for g in recon:
         if not g.any_mismatch:
             continue
-        lines.append("")
-        lines.append(
-            f"### {g.game_id} {g.away} @ {g.home} "
-            f"(TOΔ max {g.max_abs_turnovers_delta}, YdsΔ max {g.max_abs_yards_delta}, raw={g.raw_source})"
+        mismatches.append(g)
+        if g.max_abs_turnovers_delta:
+            mismatch_turnovers.append(g)
+        if g.max_abs_yards_delta:
+            mismatch_yards.append(g)
+        if any(l.penalty_yards_delta for l in g.team_lines):
+            mismatch_penalties.append(g)
+        turnover_keyword_hits += sum(map(len, g.potential_turnover_keyword_plays.values()))
+        excluded_yardage_hits += sum(map(len, g.excluded_yardage_plays.values()))
+
+    # Stream straight to disk; the trimmer keeps the previous rstrip()-then-newline file ending.
+    with path.open("w", buffering=_WRITE_BUFFER_SIZE) as fh:
+        out = _TrailingWhitespaceTrimmer(fh)
+        w = out.write
+        w(f"# Season {season} Reconciliation Report\n\n")
+        w("## Summary\n")
+        w(f"- Games analyzed: {len(recon)}\n")
+        w(f"- Mismatch games: {len(mismatches)}\n")
+        w(f"- Games with turnover mismatches: {len(mismatch_turnovers)}\n")
+        w(f"- Games with yards mismatches: {len(mismatch_yards)}\n")
+        w(f"- Games with penalty-yards mismatches: {len(mismatch_penalties)}\n")
+        if failures:
+            w(f"- Fetch/process failures: {len(failures)}\n")
+        w("\n")
+        w("## Priority Sort\n")
+        w("Sorted by `max(|turnovers_delta|) desc`, then `max(|yards_delta|) desc` per game.\n\n")
+        w("## Suggested Reconciliation Work Items (Heuristic)\n")
+        w("- Turnover deltas: review turnover classification (muffed kicks, onside recoveries, replay reversals).\n")
+        w(
+            "- Yards deltas: review how yards are attributed on turnover plays (interceptions/fumbles with returns) vs offensive yards.\n"
         )
-        lines.append("")
-        lines.append("| Team | ESPN Yds | windelta Yds | Δ | ESPN TO | windelta TO | Δ | ESPN PenYds | windelta PenYds | Δ |")
-        lines.append("|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
+        w("- Penalty deltas: review how penalties are attributed (defensive/offensive, accepted vs no-play).\n")
+        w(
+            "- Excluded plays with non-zero yards can indicate classification mismatches (penalty/no-play, special teams returns).\n"
+        )
+        w("\n")
+        w("Heuristic counts across mismatch games:\n")
+        w(f"- Potential missed turnover-keyword plays (not counted by windelta): {turnover_keyword_hits}\n")
+        w(f"- Excluded non-zero-yard plays (not counted as offense by windelta): {excluded_yardage_hits}\n\n")
+
+        w("## Games (Prioritized)\n")
+        # Defined once (not per game); the formatters and template method are bound locally.
+        v, d = _fmt_val, _fmt_delta
+        fmt_row = _MARKDOWN_TEAM_ROW_FMT.format
 
         def row(line: TeamLine) -> str:
-            return (
-                f"| {line.team} | {_fmt_val(line.espn_total_yards)} | {_fmt_val(line.windelta_total_yards)}"
-                f" | {_fmt_delta(line.yards_delta)} | {_fmt_val(line.espn_turnovers)} | {_fmt_val(line.windelta_turnovers)}"
-                f" | {_fmt_delta(line.turnovers_delta)} | {_fmt_val(line.espn_penalty_yards)} | {_fmt_val(line.windelta_penalty_yards)}"
-                f" | {_fmt_delta(line.penalty_yards_delta)} |"
+            return fmt_row(
+                team=line.team,
+                ey=v(line.espn_total_yards),
+                wy=v(line.windelta_total_yards),
+                yd=d(line.yards_delta),
+                eto=v(line.espn_turnovers),
+                wto=v(line.windelta_turnovers),
+                tod=d(line.turnovers_delta),
+                epy=v(line.espn_penalty_yards),
+                wpy=v(line.windelta_penalty_yards),
+                pyd=d(line.penalty_yards_delta),
             )
 
-        lines.append(row(away_line))
-        lines.append(row(home_line))
+        # `mismatches` keeps recon's priority order, so no re-sort or MATCH-game skipping is needed here.
+        for g in mismatches:
+            away_line, home_line = g.team_lines
+            w(
+                f"\n### {g.game_id} {g.away} @ {g.home} "
+                f"(TOΔ max {g.max_abs_turnovers_delta}, YdsΔ max {g.max_abs_yards_delta}, raw={g.raw_source})\n\n"
+            )
+            w("| Team | ESPN Yds | windelta Yds | Δ | ESPN TO | windelta TO | Δ | ESPN PenYds | windelta PenYds | Δ |\n")
+            w("|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|\n")
 
-        # Keep per-game details compact but actionable.
-        for team in (g.away, g.home):
-            to_plays = g.turnover_plays_by_team.get(team) or []
-            kw_plays = g.potential_turnover_keyword_plays.get(team) or []
-            ex_plays = g.excluded_yardage_plays.get(team) or []
-            ty_corr = g.total_yards_corrections_by_team.get(team) or []
+            w(row(away_line))
+            w(row(home_line))
 
-            if not to_plays and not kw_plays and not ex_plays and not ty_corr:
-                continue
+            # Keep per-game details compact but actionable.
+            # Bind the per-game dict lookups once; missing teams share the empty tuple instead of a fresh list.
+            to_get = g.turnover_plays_by_team.get
+            kw_get = g.potential_turnover_keyword_plays.get
+            ex_get = g.excluded_yardage_plays.get
+            ty_get = g.total_yards_corrections_by_team.get
+            for team in (g.away, g.home):
+                to_plays = to_get(team, _EMPTY)
+                kw_plays = kw_get(team, _EMPTY)
+                ex_plays = ex_get(team, _EMPTY)
+                ty_corr = ty_get(team, _EMPTY)
 
-            lines.append("")
-            lines.append(f"**{team} Reconciliation Clues**")
+                if not to_plays and not kw_plays and not ex_plays and not ty_corr:
+                    continue
 
-            if to_plays:
-                lines.append("")
-                lines.append(f"- Windelta counted turnovers ({len(to_plays)}):")
-                for p in to_plays:
-                    lines.append(p.format_line())
+                w(f"\n**{team} Reconciliation Clues**\n")
 
-            if kw_plays:
-                lines.append("")
-                lines.append(f"- Turnover-keyword plays not counted as turnovers (up to {len(kw_plays)} shown):")
-                for p in kw_plays:
-                    lines.append(p.format_line())
+                if to_plays:
+                    w(f"\n- Windelta counted turnovers ({len(to_plays)}):\n")
+                    for p in to_plays:
+                        w(f"{p.format_line()}\n")
 
-            if ex_plays:
-                lines.append("")
-                lines.append(f"- Excluded non-zero-yard plays (up to {len(ex_plays)} shown):")
-                for p in ex_plays:
-                    lines.append(p.format_line())
+                if kw_plays:
+                    w(f"\n- Turnover-keyword plays not counted as turnovers (up to {len(kw_plays)} shown):\n")
+                    for p in kw_plays:
+                        w(f"{p.format_line()}\n")
 
-            if ty_corr:
-                lines.append("")
-                lines.append(f"- Total-yards penalty corrections (up to {len(ty_corr)} shown):")
-                lines.extend(ty_corr)
+                if ex_plays:
+                    w(f"\n- Excluded non-zero-yard plays (up to {len(ex_plays)} shown):\n")
+                    for p in ex_plays:
+                        w(f"{p.format_line()}\n")
 
-    if failures:
-        lines.append("")
-        lines.append("## Failures")
-        for f in failures:
-            lines.append(f"- {f}")
+                if ty_corr:
+                    w(f"\n- Total-yards penalty corrections (up to {len(ty_corr)} shown):\n")
+                    for corr in ty_corr:
+                        w(f"{corr}\n")
 
-    path.write_text("\n".join(lines).rstrip() + "\n")
+        if failures:
+            w("\n## Failures\n")
+            for f in failures:
+                w(f"- {f}\n")
+
+        out.finish()
 
 
 def main() -> int:
@@ -1062,6 +1285,18 @@ def main() -> int:
         action="store_true",
         help="When fetching from network, write raw ESPN summary payloads to --cache-dir (so you can re-run with --source cache).",
     )
+    parser.add_argument(
+        "--cache-gzip",
+        action="store_true",
+        help="With --cache-write, store payloads as gzip (level 1) <id>.json.gz instead of plain JSON. Both forms are read.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Games to fetch/process concurrently (default: 8; use 1 for sequential). Only network fetches "
+        "benefit, so --source cache always runs sequentially.",
+    )
     parser.add_argument(
         "--espn-stats-cache",
         default=None,
@@ -1103,12 +1338,8 @@ def main() -> int:
     espn_stats_cache_path = Path(args.espn_stats_cache) if args.espn_stats_cache else None
     if not espn_stats_cache_path:
         espn_stats_cache_path = Path(os.path.join("audits", f"season_{args.season}_espn_official_stats.json"))
-    espn_stats_cache: Dict[str, Any] = {}
-    if espn_stats_cache_path.exists():
-        try:
-            espn_stats_cache = json.loads(espn_stats_cache_path.read_text())
-        except Exception:
-            espn_stats_cache = {}
+    espn_stats_cache = load_espn_stats_cache(espn_stats_cache_path)
+    espn_stats_written: Set[str] = set()
 
     cache_dir = (REPO_ROOT / args.cache_dir).resolve() if not os.path.isabs(args.cache_dir) else Path(args.cache_dir)
     recon, failures = build_season_recon(
@@ -1117,13 +1348,17 @@ def main() -> int:
         cache_dir=cache_dir,
         cache_write=args.cache_write,
         espn_stats_cache=espn_stats_cache,
+        cache_gzip=args.cache_gzip,
+        max_workers=args.workers,
+        espn_stats_written=espn_stats_written,
     )
 
-    try:
-        espn_stats_cache_path.parent.mkdir(parents=True, exist_ok=True)
-        espn_stats_cache_path.write_text(json.dumps(espn_stats_cache, indent=2))
-    except Exception:
-        pass
+    # Skip the rewrite unless an entry was extracted, either new or replacing a malformed one.
+    if espn_stats_written:
+        try:
+            save_espn_stats_cache(espn_stats_cache_path, espn_stats_cache)
+        except Exception:
+            pass
 
     # Sort for outputs.
     recon_sorted = sorted(recon, key=lambda x: x.priority_key())
@@ -1138,18 +1373,14 @@ def main() -> int:
 
     mismatch_games = len([g for g in recon_sorted if g.any_mismatch])
     print(
-        textwrap.dedent(
-            f"""
-            Wrote:
-              - Team rows: {out_team_csv}
-              - Game priority: {out_game_csv}
-              - Markdown report: {out_md}
-            Summary:
-              - Games analyzed: {len(recon_sorted)}
-              - Mismatch games: {mismatch_games}
-              - Failures: {len(failures)}
-            """
-        ).strip()
+        "Wrote:\n"
+        f"  - Team rows: {out_team_csv}\n"
+        f"  - Game priority: {out_game_csv}\n"
+        f"  - Markdown report: {out_md}\n"
+        "Summary:\n"
+        f"  - Games analyzed: {len(recon_sorted)}\n"
+        f"  - Mismatch games: {mismatch_games}\n"
+        f"  - Failures: {len(failures)}"
     )
     print_aggregate_report(recon_sorted)
 
@@ -1,36 +1,66 @@
 """
 Diagnostic script to inspect ESPN's summary endpoint and find pre-game WP.
-Run with: python debug_pregame_wp.py <game_id>
+Run with: python debug_pregame_wp.py <game_id> [--no-indent]
 
 Example game IDs to try:
   401671790  (2024 season game)
   401547417  (2023 season game)
 """
+import os
 import sys
 import json
+from collections import deque
+
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson isn't installed
+    orjson = None
+
+# Shared session so repeated calls reuse the pooled keep-alive connection.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def _dump_json(data, path: str, indent: bool = True) -> None:
+    """Write ``data`` to ``path``, preferring orjson when it is available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+    with open(path, "w") as f:
+        if indent:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
 
 
-def debug_summary_endpoint(game_id: str):
+def debug_summary_endpoint(game_id: str, indent: bool = True):
     """Fetch and dump the summary endpoint to find where pregame WP lives."""
     
     url = f"http://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={game_id}"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    
     print(f"Fetching: {url}\n")
     
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = _SESSION.get(url, timeout=15)
         response.raise_for_status()
         data = response.json()
     except Exception as e:
         print(f"ERROR fetching data: {e}")
         return
     
-    # Save full response for inspection
-    with open(f"debug_summary_{game_id}.json", "w") as f:
-        json.dump(data, f, indent=2)
-    print(f"Full response saved to: debug_summary_{game_id}.json\n")
+    # Save full response for inspection (once; repeat runs reuse the dump)
+    dump_path = f"debug_summary_{game_id}.json"
+    if os.path.exists(dump_path):
+        print(f"Full response already saved at: {dump_path}\n")
+    else:
+        _dump_json(data, dump_path, indent=indent)
+        print(f"Full response saved to: {dump_path}\n")
     
     # List top-level keys
     print("=" * 60)
@@ -115,29 +145,38 @@ def debug_summary_endpoint(game_id: str):
 
 
 def search_for_keys(obj, target_keys, path="root"):
-    """Recursively search for keys containing any of the target strings."""
+    """Walk the payload depth-first for keys containing any of the target strings."""
     found = []
-    
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            key_lower = key.lower()
-            if any(t.lower() in key_lower for t in target_keys):
-                found.append((f"{path}.{key}", value))
-            found.extend(search_for_keys(value, target_keys, f"{path}.{key}"))
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj[:3]):  # Only check first 3 items
-            found.extend(search_for_keys(item, target_keys, f"{path}[{i}]"))
-    
+    lowered = [t.lower() for t in target_keys]
+    # (path, node, key_matched) entries; children are pushed in reverse so the
+    # stack pops them in document order, matching the old recursive walk.
+    stack = deque([(path, obj, False)])
+
+    while stack:
+        node_path, node, matched = stack.pop()
+        if matched:
+            found.append((node_path, node))
+        if isinstance(node, dict):
+            children = []
+            for key, value in node.items():
+                key_lower = key.lower()
+                children.append((f"{node_path}.{key}", value, any(t in key_lower for t in lowered)))
+            stack.extend(reversed(children))
+        elif isinstance(node, list):
+            # Only check first 3 items
+            stack.extend(reversed([(f"{node_path}[{i}]", item, False) for i, item in enumerate(node[:3])]))
+
     return found
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python debug_pregame_wp.py <game_id>")
+    args = [a for a in sys.argv[1:] if a != "--no-indent"]
+    if not args:
+        print("Usage: python debug_pregame_wp.py <game_id> [--no-indent]")
         print("\nExample game IDs:")
         print("  401671790  (2024 season)")
         print("  401547417  (2023 season)")
         sys.exit(1)
     
-    game_id = sys.argv[1]
-    debug_summary_endpoint(game_id)
\ No newline at end of file
+    game_id = args[0]
+    debug_summary_endpoint(game_id, indent="--no-indent" not in sys.argv[1:])
\ No newline at end of file
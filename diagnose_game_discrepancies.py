@@ -3,17 +3,30 @@
 Diagnostic script to identify stat discrepancies between ESPN and game_compare.py.
 
 Usage:
-    python diagnose_game_discrepancies.py <game_id>
+    python diagnose_game_discrepancies.py <game_id> [<game_id> ...] [--no-cache]
+
+ESPN responses are cached under espn_cache/ (game_compare.cached_json) for a week once the
+game is final and a minute while it is live (game_compare.game_cache_ttl); pass --no-cache to
+always refetch.
 
 Example:
     python diagnose_game_discrepancies.py 401772896
 """
 
+import functools
+import io
+import re
 import sys
 import requests
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
 
 from game_compare import (
+    _SESSION,
+    _json_loads,
+    cached_json,
+    game_cache_ttl,
     get_game_data,
     process_game_stats,
     classify_offense_play,
@@ -24,7 +37,152 @@ from game_compare import (
 )
 
 
-def get_espn_official_stats(game_id):
+def _dig(d, k1, k2, default=None):
+    """`d[k1][k2]` with `default` for any missing level, without allocating throwaway `{}`s."""
+    sub = d.get(k1)
+    return sub.get(k2, default) if sub else default
+
+
+# Category/subcategory labels returned by classify_play_type and used as report dict keys.
+# Interned module constants so every key lookup hits the identity fast path.
+OFFENSIVE = sys.intern('Offensive')
+SPECIAL_TEAMS = sys.intern('Special Teams')
+PENALTY = sys.intern('Penalty')
+CLOCK_MANAGEMENT = sys.intern('Clock Management')
+OTHER = sys.intern('Other')
+UNKNOWN = sys.intern('Unknown')
+
+RUSHING = sys.intern('Rushing')
+PASSING = sys.intern('Passing')
+KICKOFF_RETURN = sys.intern('Kickoff Return')
+KICKOFF = sys.intern('Kickoff')
+PUNT_RETURN = sys.intern('Punt Return')
+PUNT = sys.intern('Punt')
+FIELD_GOAL = sys.intern('Field Goal')
+EXTRA_POINT = sys.intern('Extra Point')
+PENALTY_NO_PLAY = sys.intern('Penalty (No Play)')
+SPIKE_KNEEL = sys.intern('Spike/Kneel')
+TIMEOUT = sys.intern('Timeout')
+END_OF_PERIOD = sys.intern('End of Period')
+
+OFFENSIVE_SUBCATEGORIES = (RUSHING, PASSING, OTHER)
+RETURN_SUBCATEGORIES = (KICKOFF_RETURN, PUNT_RETURN)
+SPECIAL_TEAMS_SUBCATEGORIES = (KICKOFF_RETURN, PUNT_RETURN, KICKOFF, PUNT, FIELD_GOAL, EXTRA_POINT)
+
+
+TURNOVER_KEYWORDS = ('interception', 'intercept', 'fumble', 'muffed', 'blocked', 'turnover')
+_TURNOVER_KEYWORD_RE = re.compile('|'.join(map(re.escape, TURNOVER_KEYWORDS)))
+
+
+def turnover_keywords_in(text_lower):
+    """
+    Return the TURNOVER_KEYWORDS found in `text_lower`, in keyword order.
+    One regex scan rejects the (common) no-hit case; overlapping hits such as
+    'intercept'/'interception' are then all reported.
+    """
+    if not _TURNOVER_KEYWORD_RE.search(text_lower):
+        return []
+    return [kw for kw in TURNOVER_KEYWORDS if kw in text_lower]
+
+
+class _PlayRecord(NamedTuple):
+    """One play with the lowered strings and drive context both report passes need."""
+
+    play: dict
+    text: str
+    text_lower: str
+    play_type: str
+    type_lower: str
+    quarter: object
+    clock: object
+    drive_team_id: object
+    drive_team_abbr: str
+    opponent_id: object
+
+
+class PlayInfo(NamedTuple):
+    """A classified play as filed in the per-team counted/excluded report buckets."""
+
+    quarter: object
+    clock: object
+    play_type: str
+    yards: int
+    text: str
+    category: str
+    subcategory: str
+    counted_yards: Optional[int] = None  # None for plays excluded from Total Yards
+    note: str = ''
+
+
+def _preprocess_plays(drives, id_to_abbr):
+    """Yield a `_PlayRecord` per play across all drives, lowering each play's text and type once."""
+    # Fixed for the whole game: each team's opponent. A drive with an unknown team id falls
+    # back to the first team, as the old per-drive "first id that differs" search did.
+    opponent_of = {}
+    default_opponent = None
+    if len(id_to_abbr) == 2:
+        first_id, second_id = id_to_abbr
+        opponent_of = {first_id: second_id, second_id: first_id}
+        default_opponent = first_id
+
+    for drive in drives:
+        drive_team_id = _dig(drive, 'team', 'id')
+        drive_team_abbr = id_to_abbr.get(drive_team_id, 'UNK')
+        opponent_id = opponent_of.get(drive_team_id, default_opponent)
+
+        for play in drive.get('plays', []):
+            text = play.get('text', '') or ''
+            play_type = _dig(play, 'type', 'text', 'Unknown')
+            yield _PlayRecord(
+                play,
+                text,
+                text.lower(),
+                play_type,
+                play_type.lower(),
+                _dig(play, 'period', 'number', '?'),
+                _dig(play, 'clock', 'displayValue', '?'),
+                drive_team_id,
+                drive_team_abbr,
+                opponent_id,
+            )
+
+
+def _parse_int(value):
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_penalty_yards(value):
+    """Parse the yards half of ESPN's "count-yards" penalty display value."""
+    if isinstance(value, str) and '-' in value:
+        parts = value.split('-')
+        if len(parts) == 2:
+            return _parse_int(parts[1])
+    return None
+
+
+# ESPN boxscore stat name -> (report key, displayValue parser)
+_STAT_HANDLERS = {
+    'totalYards': ('Total Yards', _parse_int),
+    'turnovers': ('Turnovers', _parse_int),
+    'rushingYards': ('Rushing Yards', _parse_int),
+    'netPassingYards': ('Passing Yards', _parse_int),
+    'totalPenaltiesYards': ('Penalty Yards', _parse_penalty_yards),
+}
+
+
+def _fetch_summary_subset(url):
+    resp = _SESSION.get(url, timeout=30)
+    resp.raise_for_status()
+    # Parse the raw bytes directly (skips requests' text decoding) and keep only the
+    # two subtrees get_espn_official_stats reads, so the rest of the payload is freed right away.
+    data = _json_loads(resp.content)
+    return {'header': data.get('header', {}), 'boxscore': data.get('boxscore', {})}
+
+
+def get_espn_official_stats(game_id, out=None, use_cache=True):
     """
     Fetch official team stats from ESPN's summary API.
     Returns (stats_dict, game_header, team_order, away_team, home_team)
@@ -32,14 +190,14 @@ def get_espn_official_stats(game_id):
     url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={game_id}"
 
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        print(f"Error fetching ESPN data: {e}")
+        # The subset keeps the header, so the box score expires on the same schedule as the play-by-play.
+        data = cached_json(url, lambda: _fetch_summary_subset(url), use_cache, ttl=game_cache_ttl)
+        header = data.get('header', {})
+        boxscore = data.get('boxscore', {})
+    except (requests.RequestException, ValueError) as e:
+        print(f"Error fetching ESPN data: {e}", file=out)
         return None, None, None, None, None
 
-    header = data.get('header', {})
     competitions = header.get('competitions', [])
 
     away_team = None
@@ -61,7 +219,6 @@ def get_espn_official_stats(game_id):
 
     game_header = f"{away_team} {away_score} @ {home_team} {home_score} ({game_id})"
 
-    boxscore = data.get('boxscore', {})
     teams_data = boxscore.get('teams', [])
 
     espn_stats = {}
@@ -80,37 +237,13 @@ def get_espn_official_stats(game_id):
         }
 
         for stat in team_data.get('statistics', []):
-            stat_name = stat.get('name', '')
-            display_value = stat.get('displayValue', '')
-
-            if stat_name == 'totalYards':
-                try:
-                    stats['Total Yards'] = int(display_value)
-                except (ValueError, TypeError):
-                    pass
-            elif stat_name == 'turnovers':
-                try:
-                    stats['Turnovers'] = int(display_value)
-                except (ValueError, TypeError):
-                    pass
-            elif stat_name == 'rushingYards':
-                try:
-                    stats['Rushing Yards'] = int(display_value)
-                except (ValueError, TypeError):
-                    pass
-            elif stat_name == 'netPassingYards':
-                try:
-                    stats['Passing Yards'] = int(display_value)
-                except (ValueError, TypeError):
-                    pass
-            elif stat_name == 'totalPenaltiesYards':
-                if isinstance(display_value, str) and '-' in display_value:
-                    parts = display_value.split('-')
-                    if len(parts) == 2:
-                        try:
-                            stats['Penalty Yards'] = int(parts[1])
-                        except (ValueError, TypeError):
-                            pass
+            handler = _STAT_HANDLERS.get(stat.get('name', ''))
+            if handler is None:
+                continue
+            key, parse = handler
+            value = parse(stat.get('displayValue', ''))
+            if value is not None:
+                stats[key] = value
 
         espn_stats[abbr] = stats
 
@@ -119,54 +252,72 @@ def get_espn_official_stats(game_id):
     return espn_stats, game_header, team_order, away_team, home_team
 
 
-def classify_play_type(play, text_lower, type_lower):
+# Every substring classify_play_type() tests for. The lookahead makes findall() report a
+# hit at each position, so overlapping needles are all seen in one scan per string.
+_CLASSIFY_NEEDLE_RE = re.compile(
+    r'(?=(kickoff|punt|return|field goal|extra point|fg|xp|timeout|end of|end period))'
+)
+
+# (needle in text or type, subcategory when a return is mentioned, subcategory otherwise)
+_KICK_RULES = (
+    ('kickoff', KICKOFF_RETURN, KICKOFF),
+    ('punt', PUNT_RETURN, PUNT),
+)
+
+
+def classify_play_type(play, text_lower, type_lower, offense=None):
     """
     Classify a play into categories for diagnostic purposes.
+    `offense` is an already computed classify_offense_play(play) result, if the caller has one.
     Returns (category, subcategory)
     """
-    is_offense, is_run, is_pass = classify_offense_play(play)
+    is_offense, is_run, is_pass = offense if offense is not None else classify_offense_play(play)
 
     if is_offense:
         if is_run:
-            return 'Offensive', 'Rushing'
+            return OFFENSIVE, RUSHING
         elif is_pass:
-            return 'Offensive', 'Passing'
+            return OFFENSIVE, PASSING
         else:
-            return 'Offensive', 'Other'
+            return OFFENSIVE, OTHER
 
-    # Check special teams
-    if 'kickoff' in text_lower or 'kickoff' in type_lower:
-        if 'return' in text_lower or 'return' in type_lower:
-            return 'Special Teams', 'Kickoff Return'
-        return 'Special Teams', 'Kickoff'
+    text_hits = set(_CLASSIFY_NEEDLE_RE.findall(text_lower))
+    type_hits = set(_CLASSIFY_NEEDLE_RE.findall(type_lower))
+    any_hits = text_hits | type_hits
 
-    if 'punt' in text_lower or 'punt' in type_lower:
-        if 'return' in text_lower or 'return' in type_lower:
-            return 'Special Teams', 'Punt Return'
-        return 'Special Teams', 'Punt'
+    # Check special teams
+    for needle, return_subcategory, subcategory in _KICK_RULES:
+        if needle in any_hits:
+            if 'return' in any_hits:
+                return SPECIAL_TEAMS, return_subcategory
+            return SPECIAL_TEAMS, subcategory
 
-    if 'field goal' in text_lower or 'fg' in type_lower:
-        return 'Special Teams', 'Field Goal'
+    if 'field goal' in text_hits or 'fg' in type_hits:
+        return SPECIAL_TEAMS, FIELD_GOAL
 
-    if 'extra point' in text_lower or 'xp' in type_lower:
-        return 'Special Teams', 'Extra Point'
+    if 'extra point' in text_hits or 'xp' in type_hits:
+        return SPECIAL_TEAMS, EXTRA_POINT
 
     # Check for penalties
     if is_penalty_play(play, text_lower, type_lower):
-        return 'Penalty', 'Penalty (No Play)'
+        return PENALTY, PENALTY_NO_PLAY
 
     # Check for spikes/kneels
     if is_spike_or_kneel(text_lower, type_lower):
-        return 'Clock Management', 'Spike/Kneel'
+        return CLOCK_MANAGEMENT, SPIKE_KNEEL
 
     # Check for timeouts
-    if 'timeout' in type_lower:
-        return 'Other', 'Timeout'
+    if 'timeout' in type_hits:
+        return OTHER, TIMEOUT
 
-    if 'end of' in type_lower or 'end period' in type_lower:
-        return 'Other', 'End of Period'
+    if 'end of' in type_hits or 'end period' in type_hits:
+        return OTHER, END_OF_PERIOD
 
-    return 'Unknown', 'Unknown'
+    return UNKNOWN, UNKNOWN
+
+
+# Text substrings that can trigger any of analyze_turnovers' checks (type triggers are tested separately).
+_TURNOVER_PREFILTER_RE = re.compile(r'intercept|fumble|muffed|blocked|onside')
 
 
 def analyze_turnovers(play, text_lower, type_lower, offense_team_id, opponent_id, id_to_abbr):
@@ -174,8 +325,15 @@ def analyze_turnovers(play, text_lower, type_lower, offense_team_id, opponent_id
     Analyze a play for turnover indicators.
     Returns list of (team_charged, reason, is_counted) tuples
     """
+    # Most plays mention none of the turnover triggers below; skip the individual checks for them.
+    if (not _TURNOVER_PREFILTER_RE.search(text_lower)
+            and 'interception' not in type_lower and 'muff' not in type_lower):
+        return []
+
     turnovers = []
     offense_abbrev = id_to_abbr.get(offense_team_id, '').lower()
+    start_team_id = play.get('start', {}).get('team', {}).get('id') or offense_team_id
+    end_team_id = play.get('end', {}).get('team', {}).get('id')
 
     overturned = 'reversed' in text_lower or 'overturned' in text_lower
 
@@ -201,8 +359,6 @@ def analyze_turnovers(play, text_lower, type_lower, offense_team_id, opponent_id
             recovered_by_def = False
 
         # Check for possession change via team IDs
-        start_team_id = play.get('start', {}).get('team', {}).get('id') or offense_team_id
-        end_team_id = play.get('end', {}).get('team', {}).get('id')
         if start_team_id and end_team_id and start_team_id != end_team_id:
             recovered_by_def = True
 
@@ -225,8 +381,6 @@ def analyze_turnovers(play, text_lower, type_lower, offense_team_id, opponent_id
 
     # Check for blocked kick/punt
     if 'blocked' in text_lower and ('punt' in type_lower or 'field goal' in type_lower or 'fg' in type_lower):
-        start_team_id = play.get('start', {}).get('team', {}).get('id') or offense_team_id
-        end_team_id = play.get('end', {}).get('team', {}).get('id')
         if start_team_id and end_team_id and start_team_id != end_team_id:
             if overturned:
                 turnovers.append((start_team_id, 'blocked kick (overturned)', False))
@@ -235,29 +389,31 @@ def analyze_turnovers(play, text_lower, type_lower, offense_team_id, opponent_id
 
     # Check for onside kick recovery
     if 'onside' in text_lower and 'kick' in text_lower and opponent_id:
-        end_team_id = play.get('end', {}).get('team', {}).get('id')
-        start_team_id = play.get('start', {}).get('team', {}).get('id') or offense_team_id
         if end_team_id == start_team_id:  # Kicking team recovered
             turnovers.append((opponent_id, 'onside kick lost', True))
 
     return turnovers
 
 
-def diagnose_game(game_id):
-    """Main diagnostic function."""
+def diagnose_game(game_id, out=None, use_cache=True):
+    """
+    Main diagnostic function.
+    The report is printed to `out` (default: stdout) so batch runs can buffer each game.
+    """
+    emit = functools.partial(print, file=out)
 
-    print(f"Fetching ESPN official stats for game {game_id}...")
-    espn_stats, game_header, team_order, away_team, home_team = get_espn_official_stats(game_id)
+    emit(f"Fetching ESPN official stats for game {game_id}...")
+    espn_stats, game_header, team_order, away_team, home_team = get_espn_official_stats(game_id, out=out, use_cache=use_cache)
 
     if not espn_stats:
-        print("Failed to fetch ESPN stats")
+        emit("Failed to fetch ESPN stats")
         return
 
-    print(f"Fetching play-by-play data...")
-    game_data = get_game_data(game_id)
+    emit(f"Fetching play-by-play data...")
+    game_data = cached_json(f"gamepackage:{game_id}", lambda: get_game_data(game_id), use_cache, ttl=game_cache_ttl)
 
     if not game_data:
-        print("Failed to fetch game data")
+        emit("Failed to fetch game data")
         return
 
     # Get game_compare stats (unfiltered)
@@ -293,153 +449,133 @@ def diagnose_game(game_id):
     drives = game_data.get('drives', {}).get('previous', [])
 
     # Storage for analysis
+    # Per-subcategory yard totals are accumulated alongside the play lists so the
+    # report sections below never re-walk the lists just to sum them.
     plays_by_team = {team: {
         'counted': defaultdict(list),
         'excluded': defaultdict(list),
+        'counted_yards': defaultdict(int),
+        'excluded_yards': defaultdict(int),
+        'excluded_nonzero': defaultdict(list),
         'turnovers_counted': [],
         'turnovers_potential': [],
     } for team in team_order}
 
-    for drive in drives:
-        drive_team_id = drive.get('team', {}).get('id')
-        drive_team_abbr = id_to_abbr.get(drive_team_id, 'UNK')
-        opponent_id = None
-        if len(id_to_abbr) == 2:
-            opponent_id = next((tid for tid in id_to_abbr if tid != drive_team_id), None)
-
-        for play in drive.get('plays', []):
-            text = play.get('text', '') or ''
-            text_lower = text.lower()
-            play_type = play.get('type', {}).get('text', 'Unknown')
-            type_lower = play_type.lower()
-            yards = play.get('statYardage', 0) or 0
-            quarter = play.get('period', {}).get('number', '?')
-            clock = play.get('clock', {}).get('displayValue', '?')
-
-            # Skip timeouts and end of period markers
-            if 'timeout' in type_lower or 'end of' in type_lower:
+    # Single pass over the flattened plays; keyword hits are set aside for the missed-turnover scan,
+    # which can only run once every turnover has been recorded.
+    keyword_hits = []
+
+    for rec in _preprocess_plays(drives, id_to_abbr):
+        (play, text, text_lower, play_type, type_lower, quarter, clock,
+         drive_team_id, drive_team_abbr, opponent_id) = rec
+
+        keywords = turnover_keywords_in(text_lower)
+        if keywords:
+            keyword_hits.append((rec, keywords))
+
+        # Skip timeouts and end of period markers
+        if 'timeout' in type_lower or 'end of' in type_lower:
+            continue
+        yards = play.get('statYardage', 0) or 0
+
+        # Classify the play (classify_offense_play is the costliest per-play call, so share its result)
+        offense = classify_offense_play(play)
+        is_offense, is_run, is_pass = offense
+        category, subcategory = classify_play_type(play, text_lower, type_lower, offense)
+
+        # Check for turnover
+        turnover_events = analyze_turnovers(
+            play, text_lower, type_lower,
+            drive_team_id, opponent_id, id_to_abbr
+        )
+
+        # Determine which team this affects
+        play_team = drive_team_abbr
+
+        # For kickoff returns, the returning team is the opponent
+        if subcategory in RETURN_SUBCATEGORIES:
+            if opponent_id:
+                play_team = id_to_abbr.get(opponent_id, drive_team_abbr)
+
+        if play_team not in plays_by_team:
+            continue
+
+        # Determine if this play was counted toward Total Yards
+        team_bucket = plays_by_team[play_team]
+        if is_offense and (is_run or is_pass):
+            # Check if turnover zeroed out yards
+            has_turnover = any(counted for _, _, counted in turnover_events)
+            if has_turnover:
+                play_info = PlayInfo(quarter, clock, play_type, yards, text, category, subcategory,
+                                     counted_yards=0, note='Turnover - yards zeroed')
+            else:
+                play_info = PlayInfo(quarter, clock, play_type, yards, text, category, subcategory,
+                                     counted_yards=yards)
+                team_bucket['counted_yards'][subcategory] += yards
+            team_bucket['counted'][subcategory].append(play_info)
+        else:
+            play_info = PlayInfo(quarter, clock, play_type, yards, text, category, subcategory)
+            team_bucket['excluded'][subcategory].append(play_info)
+            team_bucket['excluded_yards'][subcategory] += yards
+            if yards != 0:
+                team_bucket['excluded_nonzero'][subcategory].append(play_info)
+
+        # Track turnovers
+        for team_charged_id, reason, is_counted in turnover_events:
+            team_charged_abbr = id_to_abbr.get(team_charged_id, 'UNK')
+            if team_charged_abbr not in plays_by_team:
                 continue
 
-            play_info = {
+            turnover_info = {
                 'quarter': quarter,
                 'clock': clock,
-                'type': play_type,
-                'yards': yards,
                 'text': text,
+                'reason': reason,
+                'is_counted': is_counted,
             }
 
-            # Classify the play
-            category, subcategory = classify_play_type(play, text_lower, type_lower)
-            is_offense, is_run, is_pass = classify_offense_play(play)
-
-            # Check for turnover
-            turnover_events = analyze_turnovers(
-                play, text_lower, type_lower,
-                drive_team_id, opponent_id, id_to_abbr
-            )
-
-            # Determine which team this affects
-            play_team = drive_team_abbr
-
-            # For kickoff returns, the returning team is the opponent
-            if subcategory in ['Kickoff Return', 'Punt Return']:
-                if opponent_id:
-                    play_team = id_to_abbr.get(opponent_id, drive_team_abbr)
-
-            if play_team not in plays_by_team:
-                continue
-
-            play_info['category'] = category
-            play_info['subcategory'] = subcategory
-
-            # Determine if this play was counted toward Total Yards
-            if is_offense and (is_run or is_pass):
-                # Check if turnover zeroed out yards
-                has_turnover = any(counted for _, _, counted in turnover_events)
-                if has_turnover:
-                    play_info['note'] = 'Turnover - yards zeroed'
-                    play_info['counted_yards'] = 0
-                else:
-                    play_info['counted_yards'] = yards
-                plays_by_team[play_team]['counted'][subcategory].append(play_info)
+            if is_counted:
+                plays_by_team[team_charged_abbr]['turnovers_counted'].append(turnover_info)
             else:
-                plays_by_team[play_team]['excluded'][subcategory].append(play_info)
-
-            # Track turnovers
-            for team_charged_id, reason, is_counted in turnover_events:
-                team_charged_abbr = id_to_abbr.get(team_charged_id, 'UNK')
-                if team_charged_abbr not in plays_by_team:
-                    continue
-
-                turnover_info = {
-                    'quarter': quarter,
-                    'clock': clock,
-                    'text': text,
-                    'reason': reason,
-                    'is_counted': is_counted,
-                }
-
-                if is_counted:
-                    plays_by_team[team_charged_abbr]['turnovers_counted'].append(turnover_info)
-                else:
-                    plays_by_team[team_charged_abbr]['turnovers_potential'].append(turnover_info)
+                plays_by_team[team_charged_abbr]['turnovers_potential'].append(turnover_info)
 
     # Scan for potential missed turnovers (keyword search)
-    turnover_keywords = ['interception', 'intercept', 'fumble', 'muffed', 'blocked', 'turnover']
     potential_missed = {team: [] for team in team_order}
 
-    for drive in drives:
-        drive_team_id = drive.get('team', {}).get('id')
-        drive_team_abbr = id_to_abbr.get(drive_team_id, 'UNK')
-
-        for play in drive.get('plays', []):
-            text = play.get('text', '') or ''
-            text_lower = text.lower()
-
-            has_keyword = any(kw in text_lower for kw in turnover_keywords)
-            if not has_keyword:
-                continue
-
-            # Check if this play was already counted
-            quarter = play.get('period', {}).get('number', '?')
-            clock = play.get('clock', {}).get('displayValue', '?')
-
-            already_tracked = False
-            for team in team_order:
-                for to in plays_by_team[team]['turnovers_counted']:
-                    if to['quarter'] == quarter and to['clock'] == clock:
-                        already_tracked = True
-                        break
-                for to in plays_by_team[team]['turnovers_potential']:
-                    if to['quarter'] == quarter and to['clock'] == clock:
-                        already_tracked = True
-                        break
-
-            if not already_tracked:
-                play_type = play.get('type', {}).get('text', 'Unknown')
-                potential_missed[drive_team_abbr].append({
-                    'quarter': quarter,
-                    'clock': clock,
-                    'type': play_type,
-                    'text': text,
-                    'keywords': [kw for kw in turnover_keywords if kw in text_lower],
-                })
+    # (quarter, clock) of every turnover already recorded, counted or not.
+    tracked_keys = {
+        (to['quarter'], to['clock'])
+        for team in team_order
+        for bucket in ('turnovers_counted', 'turnovers_potential')
+        for to in plays_by_team[team][bucket]
+    }
+
+    for rec, keywords in keyword_hits:
+        # Check if this play was already counted
+        if (rec.quarter, rec.clock) not in tracked_keys:
+            potential_missed[rec.drive_team_abbr].append({
+                'quarter': rec.quarter,
+                'clock': rec.clock,
+                'type': rec.play_type,
+                'text': rec.text,
+                'keywords': keywords,
+            })
 
     # ============================================
     # OUTPUT REPORT
     # ============================================
 
-    print("\n" + "=" * 80)
-    print(f"=== DIAGNOSTIC REPORT: {game_header} ===")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit(f"=== DIAGNOSTIC REPORT: {game_header} ===")
+    emit("=" * 80)
 
     # Summary comparison
-    print("\nESPN Totals:")
+    emit("\nESPN Totals:")
     for team in team_order:
         e = espn_stats.get(team, {})
-        print(f"  {team}: {e.get('Total Yards', 'N/A')} yards, {e.get('Turnovers', 'N/A')} turnovers")
+        emit(f"  {team}: {e.get('Total Yards', 'N/A')} yards, {e.get('Turnovers', 'N/A')} turnovers")
 
-    print("\ngame_compare Totals:")
+    emit("\ngame_compare Totals:")
     for team in team_order:
         g = gc_stats.get(team, {})
         e = espn_stats.get(team, {})
@@ -455,106 +591,100 @@ def diagnose_game(game_id):
         yards_str = f"(DELTA: {yards_delta:+d} yards)" if yards_delta != 0 else "(MATCH)"
         to_str = f"(DELTA: {to_delta:+d} turnovers)" if to_delta != 0 else ""
 
-        print(f"  {team}: {gc_yards} yards {yards_str}, {gc_to} turnovers {to_str}")
+        emit(f"  {team}: {gc_yards} yards {yards_str}, {gc_to} turnovers {to_str}")
 
     # Section A: Yardage by Play Type
-    print("\n" + "=" * 80)
-    print("SECTION A: YARDAGE BY PLAY TYPE")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("SECTION A: YARDAGE BY PLAY TYPE")
+    emit("=" * 80)
 
     for team in team_order:
         team_data = plays_by_team.get(team, {})
         counted = team_data.get('counted', {})
+        counted_yards = team_data.get('counted_yards', {})
 
-        print(f"\n{team} Offensive Plays (Counted toward Total Yards):")
+        emit(f"\n{team} Offensive Plays (Counted toward Total Yards):")
         total_counted = 0
 
-        for subcategory in ['Rushing', 'Passing', 'Other']:
+        for subcategory in OFFENSIVE_SUBCATEGORIES:
             plays = counted.get(subcategory, [])
             if not plays:
                 continue
 
             play_count = len(plays)
-            yard_sum = sum(p.get('counted_yards', p.get('yards', 0)) for p in plays)
+            yard_sum = counted_yards.get(subcategory, 0)
             total_counted += yard_sum
-            print(f"  {subcategory}: {play_count} plays, {yard_sum} yards")
+            emit(f"  {subcategory}: {play_count} plays, {yard_sum} yards")
 
-        print(f"  Subtotal: {total_counted} yards")
+        emit(f"  Subtotal: {total_counted} yards")
 
         # Special teams (not counted)
         excluded = team_data.get('excluded', {})
-        st_categories = ['Kickoff Return', 'Punt Return', 'Kickoff', 'Punt', 'Field Goal', 'Extra Point']
+        excluded_yards = team_data.get('excluded_yards', {})
 
-        print(f"\n{team} Special Teams (NOT Counted toward Total Yards):")
+        emit(f"\n{team} Special Teams (NOT Counted toward Total Yards):")
         has_st = False
-        for subcat in st_categories:
+        for subcat in SPECIAL_TEAMS_SUBCATEGORIES:
             plays = excluded.get(subcat, [])
             if not plays:
                 continue
             has_st = True
             play_count = len(plays)
-            yard_sum = sum(p.get('yards', 0) for p in plays)
-            flag = "  <-- POSSIBLE MISSING YARDS" if yard_sum > 0 and subcat in ['Kickoff Return', 'Punt Return'] else ""
-            print(f"  {subcat}: {play_count} plays, {yard_sum} yards{flag}")
+            yard_sum = excluded_yards.get(subcat, 0)
+            flag = "  <-- POSSIBLE MISSING YARDS" if yard_sum > 0 and subcat in RETURN_SUBCATEGORIES else ""
+            emit(f"  {subcat}: {play_count} plays, {yard_sum} yards{flag}")
 
         if not has_st:
-            print("  (none)")
+            emit("  (none)")
 
     # Section B: Excluded Plays with Yardage
-    print("\n" + "=" * 80)
-    print("SECTION B: EXCLUDED PLAYS WITH YARDAGE")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("SECTION B: EXCLUDED PLAYS WITH YARDAGE")
+    emit("=" * 80)
 
     for team in team_order:
         team_data = plays_by_team.get(team, {})
-        excluded = team_data.get('excluded', {})
+        # Only the non-zero-yard plays, bucketed while the plays were classified.
+        excluded_nonzero = team_data.get('excluded_nonzero', {})
 
-        print(f"\n{team} Excluded Plays:")
-        has_excluded = False
+        emit(f"\n{team} Excluded Plays:")
 
-        for subcat, plays in sorted(excluded.items()):
+        for subcat, plays in sorted(excluded_nonzero.items()):
             for p in plays:
-                if p.get('yards', 0) != 0:
-                    has_excluded = True
-                    q = p.get('quarter', '?')
-                    c = p.get('clock', '?')
-                    y = p.get('yards', 0)
-                    t = p.get('type', 'Unknown')
-                    txt = p.get('text', '')
-                    print(f"  Q{q} {c} | {subcat} | {y:+d} yards | {t}")
-                    print(f"    \"{txt}\"")
-
-        if not has_excluded:
-            print("  (no excluded plays with non-zero yardage)")
+                emit(f"  Q{p.quarter} {p.clock} | {subcat} | {p.yards:+d} yards | {p.play_type}")
+                emit(f"    \"{p.text}\"")
+
+        if not excluded_nonzero:
+            emit("  (no excluded plays with non-zero yardage)")
 
     # Section C: Turnovers Detected
-    print("\n" + "=" * 80)
-    print("SECTION C: TURNOVERS DETECTED BY game_compare")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("SECTION C: TURNOVERS DETECTED BY game_compare")
+    emit("=" * 80)
 
     for team in team_order:
         team_data = plays_by_team.get(team, {})
         turnovers = team_data.get('turnovers_counted', [])
 
         gc_to_count = gc_stats.get(team, {}).get('Turnovers', 0)
-        print(f"\n{team} Turnovers ({gc_to_count} detected):")
+        emit(f"\n{team} Turnovers ({gc_to_count} detected):")
 
         if not turnovers:
-            print("  (none)")
+            emit("  (none)")
         else:
             for to in turnovers:
                 q = to.get('quarter', '?')
                 c = to.get('clock', '?')
                 reason = to.get('reason', 'unknown')
                 txt = to.get('text', '')
-                print(f"  Q{q} {c} | \"{txt}\" | Reason: {reason}")
+                emit(f"  Q{q} {c} | \"{txt}\" | Reason: {reason}")
 
     # Section D: Potential Missing Turnovers
-    print("\n" + "=" * 80)
-    print("SECTION D: POTENTIAL MISSING TURNOVERS")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("SECTION D: POTENTIAL MISSING TURNOVERS")
+    emit("=" * 80)
 
-    print("\nPlays with turnover keywords NOT counted:")
+    emit("\nPlays with turnover keywords NOT counted:")
 
     has_potential = False
     for team in team_order:
@@ -566,7 +696,7 @@ def diagnose_game(game_id):
 
         if all_potential:
             has_potential = True
-            print(f"\n{team}:")
+            emit(f"\n{team}:")
             for p in all_potential:
                 q = p.get('quarter', '?')
                 c = p.get('clock', '?')
@@ -575,19 +705,19 @@ def diagnose_game(game_id):
                 keywords = p.get('keywords', [])
 
                 if reason:
-                    print(f"  Q{q} {c} | \"{txt}\" | NOT COUNTED: {reason}")
+                    emit(f"  Q{q} {c} | \"{txt}\" | NOT COUNTED: {reason}")
                 else:
-                    print(f"  Q{q} {c} | \"{txt}\" | Keywords: {keywords} <-- INVESTIGATE")
+                    emit(f"  Q{q} {c} | \"{txt}\" | Keywords: {keywords} <-- INVESTIGATE")
 
     if not has_potential:
-        print("  (none found)")
+        emit("  (none found)")
 
     # Summary
-    print("\n" + "=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit("SUMMARY")
+    emit("=" * 80)
 
-    print("\nYardage Gap Explanation:")
+    emit("\nYardage Gap Explanation:")
     for team in team_order:
         e = espn_stats.get(team, {})
         g = gc_stats.get(team, {})
@@ -597,14 +727,14 @@ def diagnose_game(game_id):
         delta = gc_yards - espn_yards
 
         if delta == 0:
-            print(f"  {team}: MATCH - no yardage discrepancy")
+            emit(f"  {team}: MATCH - no yardage discrepancy")
         else:
             team_data = plays_by_team.get(team, {})
-            excluded = team_data.get('excluded', {})
+            excluded_yards = team_data.get('excluded_yards', {})
 
-            # Calculate excluded special teams yards
-            kr_yards = sum(p.get('yards', 0) for p in excluded.get('Kickoff Return', []))
-            pr_yards = sum(p.get('yards', 0) for p in excluded.get('Punt Return', []))
+            # Excluded special teams yards (accumulated during the play loop)
+            kr_yards = excluded_yards.get(KICKOFF_RETURN, 0)
+            pr_yards = excluded_yards.get(PUNT_RETURN, 0)
 
             explanation_parts = []
             if kr_yards != 0:
@@ -614,9 +744,9 @@ def diagnose_game(game_id):
 
             explanation = " + ".join(explanation_parts) if explanation_parts else "Unknown source"
             check = "?" if abs(kr_yards + pr_yards - abs(delta)) > 5 else ""
-            print(f"  {team}: {delta:+d} yards, likely from: {explanation} {check}")
+            emit(f"  {team}: {delta:+d} yards, likely from: {explanation} {check}")
 
-    print("\nTurnover Gap Explanation:")
+    emit("\nTurnover Gap Explanation:")
     for team in team_order:
         e = espn_stats.get(team, {})
         g = gc_stats.get(team, {})
@@ -626,31 +756,50 @@ def diagnose_game(game_id):
         delta = gc_to - espn_to
 
         if delta == 0:
-            print(f"  {team}: MATCH - no turnover discrepancy")
+            emit(f"  {team}: MATCH - no turnover discrepancy")
         else:
             team_data = plays_by_team.get(team, {})
             potential = team_data.get('turnovers_potential', [])
 
             if delta < 0:
                 # game_compare has fewer - might have missed some
-                print(f"  {team}: {delta:+d} turnovers - game_compare may have missed {abs(delta)} turnover(s)")
+                emit(f"  {team}: {delta:+d} turnovers - game_compare may have missed {abs(delta)} turnover(s)")
                 if potential:
-                    print(f"    Candidates to investigate: {len(potential)} play(s) with turnover keywords")
+                    emit(f"    Candidates to investigate: {len(potential)} play(s) with turnover keywords")
             else:
                 # game_compare has more - might have overcounted
-                print(f"  {team}: {delta:+d} turnovers - game_compare may have overcounted")
+                emit(f"  {team}: {delta:+d} turnovers - game_compare may have overcounted")
 
-    print("\n" + "=" * 80)
+    emit("\n" + "=" * 80)
+
+
+def _diagnose_to_text(game_id, use_cache=True):
+    """Run diagnose_game into a buffer; errors are reported in the buffer instead of aborting the batch."""
+    buf = io.StringIO()
+    try:
+        diagnose_game(game_id, out=buf, use_cache=use_cache)
+    except Exception as e:
+        print(f"Error diagnosing game {game_id}: {e}", file=buf)
+    return buf.getvalue()
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python diagnose_game_discrepancies.py <game_id>")
+    args = sys.argv[1:]
+    use_cache = '--no-cache' not in args
+    game_ids = [a for a in args if a != '--no-cache']
+    if not game_ids:
+        print("Usage: python diagnose_game_discrepancies.py <game_id> [<game_id> ...] [--no-cache]")
         print("Example: python diagnose_game_discrepancies.py 401772896")
         sys.exit(1)
 
-    game_id = sys.argv[1]
-    diagnose_game(game_id)
+    if len(game_ids) == 1:
+        diagnose_game(game_ids[0], use_cache=use_cache)
+        return
+
+    # Overlap the ESPN round-trips; map() yields reports in argument order, so output never interleaves.
+    with ThreadPoolExecutor(max_workers=min(8, len(game_ids))) as pool:
+        for report in pool.map(functools.partial(_diagnose_to_text, use_cache=use_cache), game_ids):
+            sys.stdout.write(report)
 
 
 if __name__ == "__main__":
@@ -1,120 +1,254 @@
-"""Dump all plays from a game with their win probabilities and delta."""
+"""Dump all plays from a game with their win probabilities and delta.
+
+Writes plays_wp_<game_id>.csv per game id, or plays_wp_<game_id>.feather with --feather when pyarrow is installed.
+"""
+import argparse
+import csv
+import functools
+import io
 import sys
-from game_compare import get_game_data, get_play_probabilities, get_pregame_probabilities
-
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python dump_plays_wp.py <game_id>")
-        sys.exit(1)
-
-    game_id = sys.argv[1]
-    print(f"Fetching game {game_id}...")
-
-    game_data = get_game_data(game_id)
-    prob_map = get_play_probabilities(game_id)
-    pregame_home_wp, pregame_away_wp = get_pregame_probabilities(game_id)
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import NamedTuple, Optional
+
+
+def _dig(d, k1, k2, default=None):
+    """`d[k1][k2]` with `default` for any missing level, without allocating throwaway `{}`s."""
+    sub = d.get(k1)
+    return sub.get(k2, default) if sub else default
+
+
+class PlayRow(NamedTuple):
+    """One CSV/Feather row; WP columns are percentages, and the end/delta ones are None without WP data."""
+
+    drive_team: str
+    drive_description: str
+    play_id: str
+    quarter: object
+    clock: object
+    play_type: str
+    text: str
+    home_score: object
+    away_score: object
+    start_home_wp: float
+    start_away_wp: float
+    end_home_wp: Optional[float]
+    end_away_wp: Optional[float]
+    home_delta: Optional[float]
+    away_delta: Optional[float]
+
+
+CSV_FIELDS = PlayRow._fields
+
+
+def fmt_delta(d):
+    """Format a WP delta (percentage points) with its sign."""
+    if abs(d) < 0.05:  # Effectively zero
+        return "  0.0"
+    return f"+{d:5.1f}" if d > 0 else f"{d:6.1f}"
+
+
+def write_csv(path, rows):
+    """Write PlayRows to `path` with a header line."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(rows)
+
+
+def write_feather(path, rows):
+    """Write rows as a zstd-compressed Feather table; returns False if pyarrow can't be used."""
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError:  # pragma: no cover - optional; --feather falls back to CSV without it
+        return False
+    try:
+        table = pa.Table.from_pydict(dict(zip(CSV_FIELDS, map(list, zip(*rows)))))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type columns (e.g. '?' placeholders next to ints) don't fit a columnar schema.
+        return False
+    feather.write_feather(table, path, compression="zstd")
+    return True
+
+
+def dump_game(game_id, out=None, use_cache=True, use_feather=False, quiet=False):
+    """
+    Write one game's play-by-play WP report to `out` (stdout by default) and its CSV/Feather file.
+    With `quiet`, only the game header is reported and the per-drive/per-play lines are skipped.
+    """
+    # Imported here so `--help` and usage errors don't pay for requests.
+    from game_compare import fetch_game_inputs
+
+    emit = functools.partial(print, file=out)
+    emit(f"Fetching game {game_id}...")
+
+    # Same concurrent fetch, espn_cache/ lifetimes and WP fallbacks as game_compare.
+    game_data, prob_map, (pregame_home_wp, pregame_away_wp) = fetch_game_inputs(game_id, use_cache)
 
     # Get team info
-    comps = game_data.get('header', {}).get('competitions', [])
+    comps = _dig(game_data, 'header', 'competitions', [])
     home_abbr = away_abbr = "?"
     if comps:
         for comp in comps[0].get('competitors', []):
-            abbr = comp.get('team', {}).get('abbreviation', '?')
+            abbr = _dig(comp, 'team', 'abbreviation', '?')
             if comp.get('homeAway') == 'home':
                 home_abbr = abbr
             else:
                 away_abbr = abbr
 
-    print(f"\n{away_abbr} @ {home_abbr}")
-    print(
+    # Collect the report and write it once instead of one print() per play.
+    lines = []
+    lines.append(f"\n{away_abbr} @ {home_abbr}")
+    lines.append(
         f"Pregame WP: {away_abbr} {pregame_away_wp*100:5.1f}% / {home_abbr} {pregame_home_wp*100:5.1f}%"
     )
-    print(f"Probabilities: {len(prob_map)} plays have WP data\n")
-    print("=" * 120)
-
-    drives = game_data.get('drives', {}).get('previous', [])
-    csv_rows = []
-
-    # Track previous WP for delta calculation
+    lines.append(f"Probabilities: {len(prob_map)} plays have WP data\n")
+    lines.append("=" * 120)
+
+    drives = _dig(game_data, 'drives', 'previous', [])
+    csv_path = f"plays_wp_{game_id}.csv"
+    # Rows stream straight into the CSV; only Feather output needs them all in memory.
+    feather_rows = [] if use_feather else None
+    row_count = 0
+
+    # (home_wp, away_wp) per play id, unpacked once here rather than with two .get()s per play.
+    wp_by_play = {
+        pid: (prob.get('homeWinPercentage', 0.5), prob.get('awayWinPercentage', 0.5))
+        for pid, prob in prob_map.items()
+        if prob
+    }
+
+    # Track previous WP for delta calculation; the *_pct values are the same WPs scaled to
+    # percent once, shared by the report line and the CSV row.
     prev_home_wp = pregame_home_wp
     prev_away_wp = pregame_away_wp
-
-    for drive in drives:
-        team_abbr = drive.get('team', {}).get('abbreviation', '?')
-        drive_desc = drive.get('description', '')
-        print(f"\n--- DRIVE: {team_abbr} - {drive_desc} ---")
-
-        for play in drive.get('plays', []):
-            play_id = str(play.get('id', ''))
-            quarter = play.get('period', {}).get('number', '?')
-            clock = play.get('clock', {}).get('displayValue', '?')
-            play_type = play.get('type', {}).get('text', 'Unknown')
-            text = play.get('text', '') or ''
-
-            # Get score at this point
-            home_score = play.get('homeScore', '?')
-            away_score = play.get('awayScore', '?')
-
-            # Get WP and compute delta
-            prob = prob_map.get(play_id)
-            start_home_wp = prev_home_wp
-            start_away_wp = prev_away_wp
-            if prob:
-                home_wp = prob.get('homeWinPercentage', 0.5)
-                away_wp = prob.get('awayWinPercentage', 0.5)
-
-                # Compute delta
-                home_delta = (home_wp - prev_home_wp) * 100
-                away_delta = (away_wp - prev_away_wp) * 100
-
-                # Format delta with sign
-                def fmt_delta(d):
-                    if abs(d) < 0.05:  # Effectively zero
-                        return "  0.0"
-                    return f"+{d:5.1f}" if d > 0 else f"{d:6.1f}"
-
-                wp_str = (
-                    f"WP start {away_abbr} {start_away_wp*100:5.1f}% / {home_abbr} {start_home_wp*100:5.1f}% -> "
-                    f"end {away_abbr} {away_wp*100:5.1f}% ({fmt_delta(away_delta)}) | {home_abbr} {home_wp*100:5.1f}% ({fmt_delta(home_delta)})"
+    prev_home_pct = pregame_home_wp * 100
+    prev_away_pct = pregame_away_wp * 100
+
+    with ExitStack() as stack:
+        writer = None
+        for drive in drives:
+            team_abbr = _dig(drive, 'team', 'abbreviation', '?')
+            drive_desc = drive.get('description', '')
+            if not quiet:
+                lines.append(f"\n--- DRIVE: {team_abbr} - {drive_desc} ---")
+
+            for play in drive.get('plays', []):
+                play_id = str(play.get('id', ''))
+                quarter = _dig(play, 'period', 'number', '?')
+                clock = _dig(play, 'clock', 'displayValue', '?')
+                play_type = _dig(play, 'type', 'text', 'Unknown')
+                text = play.get('text', '') or ''
+
+                # Get score at this point
+                home_score = play.get('homeScore', '?')
+                away_score = play.get('awayScore', '?')
+
+                # Get WP and compute delta
+                wp = wp_by_play.get(play_id)
+                start_home_pct = prev_home_pct
+                start_away_pct = prev_away_pct
+                if wp:
+                    home_wp, away_wp = wp
+
+                    # Compute delta
+                    home_delta = (home_wp - prev_home_wp) * 100
+                    away_delta = (away_wp - prev_away_wp) * 100
+                    home_pct = home_wp * 100
+                    away_pct = away_wp * 100
+
+                    # Update previous
+                    prev_home_wp = home_wp
+                    prev_away_wp = away_wp
+                    prev_home_pct = home_pct
+                    prev_away_pct = away_pct
+                else:
+                    home_pct = away_pct = home_delta = away_delta = None
+
+                if not quiet:
+                    if home_pct is None:
+                        wp_end = "end (no WP data)"
+                    else:
+                        wp_end = (
+                            f"end {away_abbr} {away_pct:5.1f}% ({fmt_delta(away_delta)}) | "
+                            f"{home_abbr} {home_pct:5.1f}% ({fmt_delta(home_delta)})"
+                        )
+                    lines.append(
+                        f"Q{quarter} {clock:>5} | {away_abbr} {away_score}-{home_score} {home_abbr} | "
+                        f"WP start {away_abbr} {start_away_pct:5.1f}% / {home_abbr} {start_home_pct:5.1f}% -> "
+                        f"{wp_end} | {play_type}: {text}"
+                    )
+
+                row = PlayRow(
+                    team_abbr, drive_desc, play_id, quarter, clock, play_type, text,
+                    home_score, away_score,
+                    round(start_home_pct, 3),
+                    round(start_away_pct, 3),
+                    None if home_pct is None else round(home_pct, 3),
+                    None if away_pct is None else round(away_pct, 3),
+                    None if home_delta is None else round(home_delta, 3),
+                    None if away_delta is None else round(away_delta, 3),
                 )
+                row_count += 1
+                if feather_rows is not None:
+                    feather_rows.append(row)
+                    continue
+                if writer is None:
+                    # Opened on the first play so games without plays leave no empty CSV behind.
+                    writer = csv.writer(stack.enter_context(open(csv_path, "w", newline="", encoding="utf-8")))
+                    writer.writerow(CSV_FIELDS)
+                writer.writerow(row)
+
+    (sys.stdout if out is None else out).write("\n".join(lines) + "\n")
+
+    if feather_rows:
+        feather_path = f"plays_wp_{game_id}.feather"
+        if write_feather(feather_path, feather_rows):
+            emit(f"\nFeather written to {feather_path} ({row_count} rows)")
+            return
+        emit("\nFeather output unavailable (needs pyarrow and uniformly typed columns); writing CSV instead.")
+        write_csv(csv_path, feather_rows)
+
+    if row_count:
+        emit(f"\nCSV written to {csv_path} ({row_count} rows)")
+
+
+def _dump_to_text(game_id, use_cache=True, use_feather=False, quiet=False):
+    """Run dump_game into a buffer; errors are reported in the buffer instead of aborting the batch."""
+    buf = io.StringIO()
+    try:
+        dump_game(game_id, out=buf, use_cache=use_cache, use_feather=use_feather, quiet=quiet)
+    except Exception as e:
+        print(f"Error dumping game {game_id}: {e}", file=buf)
+    return buf.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dump every play of a game with its win probability and delta")
+    parser.add_argument("game_ids", nargs="+", metavar="game_id", help="ESPN gameId(s) to dump")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the espn_cache/ directory and refetch")
+    parser.add_argument(
+        "--feather", action="store_true", help="Write plays_wp_<game_id>.feather (requires pyarrow) instead of CSV"
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Skip the per-play report lines; only write the CSV/Feather file"
+    )
+    args = parser.parse_args()
+
+    game_ids = args.game_ids
+    use_cache = not args.no_cache
+    use_feather = args.feather
+    if len(game_ids) == 1:
+        dump_game(game_ids[0], use_cache=use_cache, use_feather=use_feather, quiet=args.quiet)
+        return
+
+    # The fetches dominate; overlap them across games. map() yields reports in argument order.
+    dump = functools.partial(_dump_to_text, use_cache=use_cache, use_feather=use_feather, quiet=args.quiet)
+    with ThreadPoolExecutor(max_workers=min(8, len(game_ids))) as pool:
+        for report in pool.map(dump, game_ids):
+            sys.stdout.write(report)
 
-                # Update previous
-                prev_home_wp = home_wp
-                prev_away_wp = away_wp
-            else:
-                wp_str = (
-                    f"WP start {away_abbr} {start_away_wp*100:5.1f}% / {home_abbr} {start_home_wp*100:5.1f}% -> end (no WP data)"
-                )
-                home_wp = away_wp = home_delta = away_delta = None
-
-            print(f"Q{quarter} {clock:>5} | {away_abbr} {away_score}-{home_score} {home_abbr} | {wp_str} | {play_type}: {text}")
-
-            csv_rows.append({
-                "drive_team": team_abbr,
-                "drive_description": drive_desc,
-                "play_id": play_id,
-                "quarter": quarter,
-                "clock": clock,
-                "play_type": play_type,
-                "text": text,
-                "home_score": home_score,
-                "away_score": away_score,
-                "start_home_wp": round(start_home_wp * 100, 3),
-                "start_away_wp": round(start_away_wp * 100, 3),
-                "end_home_wp": None if home_wp is None else round(home_wp * 100, 3),
-                "end_away_wp": None if away_wp is None else round(away_wp * 100, 3),
-                "home_delta": None if home_delta is None else round(home_delta, 3),
-                "away_delta": None if away_delta is None else round(away_delta, 3),
-            })
-
-    if csv_rows:
-        import csv
-        csv_path = f"plays_wp_{game_id}.csv"
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(csv_rows[0].keys()))
-            writer.writeheader()
-            writer.writerows(csv_rows)
-        print(f"\nCSV written to {csv_path} ({len(csv_rows)} rows)")
 
 if __name__ == "__main__":
     main()
@@ -1,15 +1,25 @@
 import argparse
+import hashlib
 import os
 import sys
+import time
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson isn't installed
+    orjson = None
+
 try:
     from dotenv import load_dotenv
 except ImportError:  # pragma: no cover - fallback for environments without python-dotenv
     def load_dotenv(*args, **kwargs):
         return False
-from openai import OpenAI
 
 # Add api/ to path for shared core imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api'))
@@ -29,6 +39,8 @@ from lib.nfl_core import (
 
 load_dotenv('.env.local')
 
+GAME_SUMMARY_MODEL = "gpt-4o-mini"  # Update to gpt-5-mini when available
+
 GAME_SUMMARY_SYSTEM_PROMPT = """You generate 280-character NFL game summaries that explain the score.
 
 ## FACTOR PRIORITY
@@ -105,23 +117,106 @@ def parse_clock_to_seconds(display_value):
         return None
 
 
+# Shared session so the game, probabilities and summary fetches reuse pooled keep-alive
+# connections (one TLS handshake per host) and ask for gzip-compressed JSON. Rate limits and
+# transient gateway errors are retried with a short backoff instead of failing the run.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip, deflate'})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+))
+
+
+# On-disk cache for ESPN responses, shared by the diagnostic scripts (which expose --no-cache).
+ESPN_CACHE_DIR = "espn_cache"
+ESPN_CACHE_TTL_SECONDS = 3600
+# Finished games don't change (beyond rare stat corrections); live ones are re-read within a minute.
+ESPN_FINAL_CACHE_TTL_SECONDS = 7 * 24 * 3600
+ESPN_LIVE_CACHE_TTL_SECONDS = 60
+
+
+def _json_loads(data):
+    """Decode JSON bytes/str, preferring orjson (several times faster on ESPN's large payloads)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def cached_json(key, fetch, use_cache=True, ttl=None):
+    """
+    Return `fetch()`'s JSON-serializable result, reusing a copy cached on disk under `key`
+    for up to `ttl` seconds (default ESPN_CACHE_TTL_SECONDS). `ttl` may also be a function
+    of the cached data, e.g. game_cache_ttl. Cache read/write problems fall back to fetching.
+    """
+    if not use_cache:
+        return fetch()
+
+    if ttl is None:
+        ttl = ESPN_CACHE_TTL_SECONDS
+    cache_path = os.path.join(ESPN_CACHE_DIR, f"{hashlib.md5(key.encode()).hexdigest()}.json")
+    try:
+        age = time.time() - os.path.getmtime(cache_path)
+        if callable(ttl) or age < ttl:
+            with open(cache_path, 'rb') as f:
+                data = _json_loads(f.read())
+            if not callable(ttl) or age < ttl(data):
+                return data
+    except (OSError, ValueError):
+        pass
+
+    data = fetch()
+    try:
+        os.makedirs(ESPN_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+def _game_is_final(game_data):
+    competitions = game_data.get('header', {}).get('competitions') or [{}]
+    return bool(competitions[0].get('status', {}).get('type', {}).get('completed', False))
+
+
+def game_cache_ttl(game_data):
+    """Cache lifetime for a game package: long once the game is final, short while live."""
+    return ESPN_FINAL_CACHE_TTL_SECONDS if _game_is_final(game_data) else ESPN_LIVE_CACHE_TTL_SECONDS
+
+
+def _wp_feed_cache_ttl(entry):
+    """
+    Cache lifetime for a WP feed entry (see fetch_game_inputs), from the game state it was fetched
+    in. A feed missing pages keeps the live lifetime even for a final game, so it is soon refetched.
+    """
+    if not isinstance(entry, dict) or 'feed' not in entry:
+        return 0  # Written before feeds were stamped; refetch.
+    if entry.get('final') and entry.get('complete'):
+        return ESPN_FINAL_CACHE_TTL_SECONDS
+    return ESPN_LIVE_CACHE_TTL_SECONDS
+
+
 def get_game_data(game_id):
     """Pull the full game play-by-play JSON from ESPN core API."""
-    import time
     cache_buster = int(time.time())
     url = f"https://cdn.espn.com/core/nfl/playbyplay?xhr=1&gameId={game_id}&cb={cache_buster}"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, timeout=30)
     response.raise_for_status()
-    data = response.json()
+    data = _json_loads(response.content)
     return data.get('gamepackageJSON', {})
 
-def get_play_probabilities(game_id):
+def get_play_probabilities(game_id, return_complete=False):
     """
     Pull the v2 probabilities feed and map play_id -> probability payload.
-    Returns a dict mapping play_id -> probability payload.
+    Returns a dict mapping play_id -> probability payload; a failed page ends the map early.
+    With `return_complete`, returns (prob_map, complete) where `complete` is False if any page failed.
     """
-    headers = {'User-Agent': 'Mozilla/5.0'}
     base = f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/events/{game_id}/competitions/{game_id}/probabilities"
     prob_map = {}
 
@@ -134,16 +229,16 @@ def get_play_probabilities(game_id):
             return None
         return path.rstrip('/').split('/')[-1]
 
-    page = 1
-    page_count = 1
-    while page <= page_count:
+    def fetch_page(page):
+        """Return one page's JSON, or None if it couldn't be fetched."""
         try:
-            resp = requests.get(f"{base}?page={page}", headers=headers, timeout=15)
+            resp = _SESSION.get(f"{base}?page={page}", timeout=15)
             resp.raise_for_status()
-            data = resp.json()
+            return _json_loads(resp.content)
         except Exception:
-            break
+            return None
 
+    def merge_page(data):
         items = data.get('items') or []
         for item in items:
             pid = extract_play_id(item.get('play', {}).get('$ref')) or item.get('id')
@@ -154,26 +249,40 @@ def get_play_probabilities(game_id):
                 "awayWinPercentage": item.get("awayWinPercentage"),
                 "tiePercentage": item.get("tiePercentage")
             }
-        page_count = data.get('pageCount') or page_count
-        page += 1
-
-    return prob_map
 
-
-def get_pregame_probabilities(game_id):
+    # Page 1 tells us the page count; the rest are fetched concurrently. map() keeps page
+    # order, and a failed page still ends the merge there, as the sequential walk did.
+    first = fetch_page(1)
+    complete = first is not None
+    if complete:
+        merge_page(first)
+        page_count = first.get('pageCount') or 1
+        if page_count > 1:
+            with ThreadPoolExecutor(max_workers=min(8, page_count - 1)) as pool:
+                for data in pool.map(fetch_page, range(2, page_count + 1)):
+                    if data is None:
+                        complete = False
+                        break
+                    merge_page(data)
+
+    return (prob_map, complete) if return_complete else prob_map
+
+
+def get_pregame_probabilities(game_id, strict=False):
     """
     Fetch pre-game win probabilities from ESPN summary winprobability array.
     Uses the first entry as the opening WP; returns (home_wp, away_wp).
-    Falls back to (0.5, 0.5) if unavailable.
+    Falls back to (0.5, 0.5) if unavailable; with `strict`, a failed request raises instead.
     """
-    headers = {'User-Agent': 'Mozilla/5.0'}
     url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={game_id}"
 
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = _SESSION.get(url, timeout=15)
         resp.raise_for_status()
-        data = resp.json() or {}
+        data = _json_loads(resp.content) or {}
     except Exception:
+        if strict:
+            raise
         return 0.5, 0.5
 
     def clamp(val, fallback=0.5):
@@ -192,6 +301,44 @@ def get_pregame_probabilities(game_id):
     return home_wp, away_wp
 
 
+def fetch_game_inputs(game_id, use_cache=True):
+    """
+    Fetch the game package, pregame WP and per-play WP feed concurrently (each through cached_json).
+    Returns (game_data, probability_map, (pregame_home_wp, pregame_away_wp)). A failed pregame
+    fetch falls back to (0.5, 0.5) without being cached; a probabilities feed missing pages keeps
+    the pages it got but is only cached for the live lifetime, so the next run soon retries.
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        game_future = pool.submit(
+            cached_json, f"gamepackage:{game_id}", lambda: get_game_data(game_id), use_cache, ttl=game_cache_ttl
+        )
+
+        # The WP feeds settle when the game does. Each one is cached with the game's state at
+        # fetch time, so a feed fetched mid-game keeps the live lifetime even after the game ends.
+        # `fetch` returns (feed, complete); the strict pregame fetch raises rather than cache a fallback.
+        def fetch_wp_feed(fetch):
+            feed, complete = fetch()
+            return {'final': _game_is_final(game_future.result()), 'complete': complete, 'feed': feed}
+
+        pregame_future = pool.submit(
+            cached_json, f"pregame:{game_id}",
+            lambda: fetch_wp_feed(lambda: (get_pregame_probabilities(game_id, strict=True), True)),
+            use_cache, ttl=_wp_feed_cache_ttl,
+        )
+        prob_future = pool.submit(
+            cached_json, f"probabilities:{game_id}",
+            lambda: fetch_wp_feed(lambda: get_play_probabilities(game_id, return_complete=True)),
+            use_cache, ttl=_wp_feed_cache_ttl,
+        )
+        game_data = game_future.result()
+        try:
+            pregame_home_wp, pregame_away_wp = pregame_future.result()['feed']
+        except Exception:
+            pregame_home_wp, pregame_away_wp = 0.5, 0.5
+        prob_map = prob_future.result()['feed']
+    return game_data, prob_map, (pregame_home_wp, pregame_away_wp)
+
+
 def latest_play_from_core(game_data):
     """Return (period, clock_seconds) of the last play in drives.previous."""
     drives = game_data.get('drives', {}).get('previous', [])
@@ -211,64 +358,89 @@ def latest_play_from_v2(game_id):
     return None, None
 
 
-def build_top_plays_by_wp(game_data, probability_map, wp_threshold=0.975, limit=10):
+class WPPlay(NamedTuple):
+    """A play that has win-probability data, as walked by the WP summary helpers."""
+
+    period: Optional[int]
+    clock: Optional[str]
+    drive_team: str
+    text: str
+    home_wp: float
+    away_wp: float
+
+
+def build_wp_play_index(game_data, probability_map):
     """
-    Build a simple list of top plays by WP delta for the LLM.
-    Only includes plays that are competitive at the start OR end of the play,
-    with ≥5% WP swing, sorted by impact.
+    Walk drives.previous once and return the plays that have WP data, in game order,
+    with their drive team resolved and probabilities unpacked.
     """
-    plays_with_delta = []
-
-    teams_info = game_data.get('boxscore', {}).get('teams', [])
     id_to_abbr = {}
-    for t in teams_info:
-        tid = t.get('team', {}).get('id')
-        abbr = t.get('team', {}).get('abbreviation', '?')
+    for t in game_data.get('boxscore', {}).get('teams', []):
+        team = t.get('team', {})
+        tid = team.get('id')
         if tid:
-            id_to_abbr[tid] = abbr
+            id_to_abbr[tid] = team.get('abbreviation', '?')
 
-    prev_home_wp = 0.5
-    prev_away_wp = 0.5
-    drives = game_data.get('drives', {}).get('previous', [])
-
-    for drive in drives:
+    wp_plays = []
+    for drive in game_data.get('drives', {}).get('previous', []):
         drive_team = id_to_abbr.get(drive.get('team', {}).get('id'), '?')
-
         for play in drive.get('plays', []):
-            play_id = str(play.get('id', ''))
-            period = play.get('period', {}).get('number', 0)
-
-            prob = probability_map.get(play_id)
+            prob = probability_map.get(str(play.get('id', '')))
             if not prob:
                 continue
+            wp_plays.append(WPPlay(
+                play.get('period', {}).get('number'),
+                play.get('clock', {}).get('displayValue'),
+                drive_team,
+                play.get('text', '') or '',
+                prob.get('homeWinPercentage', 0.5),
+                prob.get('awayWinPercentage', 0.5),
+            ))
+    return wp_plays
+
+
+def build_top_plays_by_wp(game_data, probability_map, wp_threshold=0.975, limit=10, wp_plays=None):
+    """
+    Build a simple list of top plays by WP delta for the LLM.
+    Only includes plays that are competitive at the start OR end of the play,
+    with ≥5% WP swing, sorted by impact. Pass `wp_plays` (build_wp_play_index) to reuse a walk.
+    """
+    if wp_plays is None:
+        wp_plays = build_wp_play_index(game_data, probability_map)
+    plays_with_delta = []
 
-            start_home_wp = prev_home_wp
-            start_away_wp = prev_away_wp
-
-            home_wp = prob.get('homeWinPercentage', 0.5)
-            away_wp = prob.get('awayWinPercentage', 0.5)
-
-            # Skip plays that are non-competitive at both start and end (unless OT)
-            start_max = max(start_home_wp, start_away_wp)
-            end_max = max(home_wp, away_wp)
-            if period < 5 and start_max >= wp_threshold and end_max >= wp_threshold:
-                prev_home_wp = home_wp
-                prev_away_wp = away_wp
-                continue
+    prev_home_wp = 0.5
+    prev_away_wp = 0.5
 
-            delta = abs(home_wp - prev_home_wp) * 100
+    for play in wp_plays:
+        period = 0 if play.period is None else play.period
+        start_home_wp = prev_home_wp
+        start_away_wp = prev_away_wp
 
-            if delta >= 5:  # Only include plays with meaningful impact
-                plays_with_delta.append({
-                    'delta': round(delta, 1),
-                    'quarter': period,
-                    'clock': play.get('clock', {}).get('displayValue', ''),
-                    'team': drive_team,
-                    'text': play.get('text', '') or ''
-                })
+        home_wp = play.home_wp
+        away_wp = play.away_wp
 
+        # Skip plays that are non-competitive at both start and end (unless OT)
+        start_max = max(start_home_wp, start_away_wp)
+        end_max = max(home_wp, away_wp)
+        if period < 5 and start_max >= wp_threshold and end_max >= wp_threshold:
             prev_home_wp = home_wp
             prev_away_wp = away_wp
+            continue
+
+        delta = abs(home_wp - prev_home_wp) * 100
+
+        if delta >= 5:  # Only include plays with meaningful impact
+            plays_with_delta.append({
+                'delta': round(delta, 1),
+                'quarter': period,
+                'clock': '' if play.clock is None else play.clock,
+                'team': play.drive_team,
+                'text': play.text
+            })
+
+        prev_home_wp = home_wp
+        prev_away_wp = away_wp
 
     # Sort by delta descending, take top N
     plays_with_delta.sort(key=lambda x: x['delta'], reverse=True)
@@ -282,53 +454,39 @@ def build_top_plays_by_wp(game_data, probability_map, wp_threshold=0.975, limit=
     return "\n".join(lines) if lines else "No high-impact plays (5%+ WP delta)"
 
 
-def calculate_wp_trajectory_stats(game_data, probability_map, leader_is_home):
+def calculate_wp_trajectory_stats(game_data, probability_map, leader_is_home, wp_plays=None):
     """
     Calculate WP trajectory statistics.
     Uses 'leader' instead of 'winner' to work for in-progress games.
+    Pass `wp_plays` (build_wp_play_index) to reuse a walk.
     """
+    if wp_plays is None:
+        wp_plays = build_wp_play_index(game_data, probability_map)
     leader_min_wp = 100.0
     wp_crossings = 0
     max_wp_delta = 0.0
     max_wp_play_desc = ""
 
-    prev_home_wp = 0.5
-    prev_above_50 = None
-
-    drives = game_data.get('drives', {}).get('previous', [])
-
-    for drive in drives:
-        for play in drive.get('plays', []):
-            play_id = str(play.get('id', ''))
-            prob = probability_map.get(play_id)
-
-            if not prob:
-                continue
+    if wp_plays:
+        # Deferred like pandas/openai so importing this module stays light.
+        import numpy as np
 
-            home_wp = prob.get('homeWinPercentage', 0.5)
-            away_wp = prob.get('awayWinPercentage', 0.5)
-
-            # Track leader's minimum WP
-            leader_wp = home_wp if leader_is_home else away_wp
-            if leader_wp < leader_min_wp:
-                leader_min_wp = leader_wp
-
-            # Track 50% line crossings
-            currently_above_50 = home_wp > 0.5
-            if prev_above_50 is not None and currently_above_50 != prev_above_50:
-                wp_crossings += 1
-            prev_above_50 = currently_above_50
-
-            # Track max WP delta
-            delta = abs(home_wp - prev_home_wp) * 100
-            if delta > max_wp_delta:
-                max_wp_delta = delta
-                play_text = play.get('text', '') or ''
-                quarter = play.get('period', {}).get('number', '?')
-                clock = play.get('clock', {}).get('displayValue', '?')
-                max_wp_play_desc = f"Q{quarter} {clock} - {play_text}"
+        home_wp = np.fromiter((p.home_wp for p in wp_plays), dtype=float, count=len(wp_plays))
+        leader_wp = home_wp if leader_is_home else np.fromiter(
+            (p.away_wp for p in wp_plays), dtype=float, count=len(wp_plays)
+        )
 
-            prev_home_wp = home_wp
+        # Leader's minimum WP, 50% line crossings, and the largest swing (first one wins ties)
+        leader_min_wp = float(leader_wp.min())
+        wp_crossings = int(np.count_nonzero(np.diff(home_wp > 0.5)))
+        deltas = np.abs(np.diff(home_wp, prepend=0.5)) * 100
+        max_idx = int(deltas.argmax())
+        if deltas[max_idx] > 0:
+            max_wp_delta = float(deltas[max_idx])
+            play = wp_plays[max_idx]
+            quarter = '?' if play.period is None else play.period
+            clock = '?' if play.clock is None else play.clock
+            max_wp_play_desc = f"Q{quarter} {clock} - {play.text}"
 
     return {
         'leader_min_wp': round(leader_min_wp * 100, 1),
@@ -338,91 +496,99 @@ def calculate_wp_trajectory_stats(game_data, probability_map, leader_is_home):
     }
 
 
-def generate_game_summary(payload, game_data, probability_map, wp_threshold=0.975):
-    """
-    Generate a concise game summary using OpenAI.
-    Handles both completed and in-progress games.
-    """
-    api_key = os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        return None
 
-    try:
-        client = OpenAI(api_key=api_key)
+# (prompt label, advanced_table column) pairs for each team's line in the summary prompt
+_PROMPT_TEAM_STATS = (
+    ("TO", "Turnovers"),
+    ("SR", "Success Rate"),
+    ("Exp", "Explosive Plays"),
+    ("PPT", "Points Per Trip (Inside 40)"),
+    ("Non-Off", "Non-Offensive Points"),
+)
 
-        # Extract game info
-        team_meta = payload.get('team_meta', [])
-        away = next((t for t in team_meta if t.get('homeAway') == 'away'), {})
-        home = next((t for t in team_meta if t.get('homeAway') == 'home'), {})
-        away_abbr = away.get('abbr', 'AWAY')
-        home_abbr = home.get('abbr', 'HOME')
-        away_name = away.get('name', away_abbr)
-        home_name = home.get('name', home_abbr)
-
-        # Get scores
-        summary_map = {row.get('Team'): row for row in payload.get('summary_table', [])}
-        away_score = summary_map.get(away_abbr, {}).get('Score', 0)
-        home_score = summary_map.get(home_abbr, {}).get('Score', 0)
-
-        # Determine game status
-        game_status = "Final"
-        is_final = True
-        header = game_data.get('header', {})
-        competitions = header.get('competitions', [])
-        if competitions:
-            status_obj = competitions[0].get('status', {})
-            status_type = status_obj.get('type', {})
-            is_final = status_type.get('completed', False)
 
-            if not is_final:
-                period = status_obj.get('period', 0)
-                clock = status_obj.get('displayClock', '')
-                if period <= 4:
-                    game_status = f"Q{period} {clock}" if clock else f"Q{period}"
-                else:
-                    game_status = f"OT {clock}" if clock else "OT"
+def _format_team_stats_line(abbr, stats):
+    """One team's 'ABBR: TO x | SR y | ...' line for the summary prompt."""
+    return f"{abbr}: " + " | ".join(f"{label} {stats.get(col, 'N/A')}" for label, col in _PROMPT_TEAM_STATS)
+
+
+def build_game_summary_prompt(payload, game_data, probability_map, wp_threshold=0.975):
+    """Build the user prompt for the LLM game summary from the computed payload and WP data."""
+    # Extract game info
+    team_meta = payload.get('team_meta', [])
+    away = next((t for t in team_meta if t.get('homeAway') == 'away'), {})
+    home = next((t for t in team_meta if t.get('homeAway') == 'home'), {})
+    away_abbr = away.get('abbr', 'AWAY')
+    home_abbr = home.get('abbr', 'HOME')
+    away_name = away.get('name', away_abbr)
+    home_name = home.get('name', home_abbr)
+
+    # Get scores
+    summary_map = {row.get('Team'): row for row in payload.get('summary_table', [])}
+    away_score = summary_map.get(away_abbr, {}).get('Score', 0)
+    home_score = summary_map.get(home_abbr, {}).get('Score', 0)
+
+    # Determine game status
+    game_status = "Final"
+    is_final = True
+    header = game_data.get('header', {})
+    competitions = header.get('competitions', [])
+    if competitions:
+        status_obj = competitions[0].get('status', {})
+        status_type = status_obj.get('type', {})
+        is_final = status_type.get('completed', False)
+
+        if not is_final:
+            period = status_obj.get('period', 0)
+            clock = status_obj.get('displayClock', '')
+            if period <= 4:
+                game_status = f"Q{period} {clock}" if clock else f"Q{period}"
             else:
-                game_status = "Final"
-
-        # Determine leader
-        if home_score > away_score:
-            leader_abbr = home_abbr
-            margin = home_score - away_score
-            leader_line = f"{home_abbr} {'won' if is_final else 'leads'} by {margin}"
-        elif away_score > home_score:
-            leader_abbr = away_abbr
-            margin = away_score - home_score
-            leader_line = f"{away_abbr} {'won' if is_final else 'leads'} by {margin}"
+                game_status = f"OT {clock}" if clock else "OT"
         else:
-            leader_abbr = home_abbr  # Default for WP calc
-            leader_line = "Tied game"
-
-        # Get advanced stats
-        advanced_map = {row.get('Team'): row for row in payload.get('advanced_table', [])}
-        away_stats = advanced_map.get(away_abbr, {})
-        home_stats = advanced_map.get(home_abbr, {})
-
-        # Calculate WP trajectory stats
-        leader_is_home = home_score >= away_score
-        wp_stats = calculate_wp_trajectory_stats(game_data, probability_map, leader_is_home)
-
-        # Build top plays list
-        top_plays = build_top_plays_by_wp(game_data, probability_map, wp_threshold, limit=10)
-
-        # Summary focus based on game state
-        if is_final:
-            if home_score != away_score:
-                summary_focus = f"why {leader_abbr} won"
-            else:
-                summary_focus = "how the game ended in a tie"
+            game_status = "Final"
+
+    # Determine leader
+    if home_score > away_score:
+        leader_abbr = home_abbr
+        margin = home_score - away_score
+        leader_line = f"{home_abbr} {'won' if is_final else 'leads'} by {margin}"
+    elif away_score > home_score:
+        leader_abbr = away_abbr
+        margin = away_score - home_score
+        leader_line = f"{away_abbr} {'won' if is_final else 'leads'} by {margin}"
+    else:
+        leader_abbr = home_abbr  # Default for WP calc
+        leader_line = "Tied game"
+
+    # Get advanced stats
+    advanced_map = {row.get('Team'): row for row in payload.get('advanced_table', [])}
+    away_stats = advanced_map.get(away_abbr, {})
+    home_stats = advanced_map.get(home_abbr, {})
+
+    # Calculate WP trajectory stats
+    leader_is_home = home_score >= away_score
+    # Both WP passes read the same index, so the drives are walked once.
+    wp_plays = build_wp_play_index(game_data, probability_map)
+    wp_stats = calculate_wp_trajectory_stats(game_data, probability_map, leader_is_home, wp_plays=wp_plays)
+
+    # Build top plays list
+    top_plays = build_top_plays_by_wp(game_data, probability_map, wp_threshold, limit=10, wp_plays=wp_plays)
+
+    # Summary focus based on game state
+    if is_final:
+        if home_score != away_score:
+            summary_focus = f"why {leader_abbr} won"
         else:
-            if home_score != away_score:
-                summary_focus = f"why {leader_abbr} leads"
-            else:
-                summary_focus = "why the game is tied"
+            summary_focus = "how the game ended in a tie"
+    else:
+        if home_score != away_score:
+            summary_focus = f"why {leader_abbr} leads"
+        else:
+            summary_focus = "why the game is tied"
 
-        # Build compact user prompt
-        user_prompt = f"""Generate a game summary:
+    # Build compact user prompt
+    user_prompt = f"""Generate a game summary:
 
 {away_name} ({away_abbr}) {away_score} @ {home_name} ({home_abbr}) {home_score}
 Status: {game_status}
@@ -430,8 +596,8 @@ Status: {game_status}
 
 ## STATS (competitive plays only):
 
-{away_abbr}: TO {away_stats.get('Turnovers', 'N/A')} | SR {away_stats.get('Success Rate', 'N/A')} | Exp {away_stats.get('Explosive Plays', 'N/A')} | PPT {away_stats.get('Points Per Trip (Inside 40)', 'N/A')} | Non-Off {away_stats.get('Non-Offensive Points', 'N/A')}
-{home_abbr}: TO {home_stats.get('Turnovers', 'N/A')} | SR {home_stats.get('Success Rate', 'N/A')} | Exp {home_stats.get('Explosive Plays', 'N/A')} | PPT {home_stats.get('Points Per Trip (Inside 40)', 'N/A')} | Non-Off {home_stats.get('Non-Offensive Points', 'N/A')}
+{_format_team_stats_line(away_abbr, away_stats)}
+{_format_team_stats_line(home_abbr, home_stats)}
 
 ## KEY WP MOMENTS:
 
@@ -444,17 +610,50 @@ Status: {game_status}
 
 Write a concise summary (~280 chars) explaining {summary_focus}."""
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Update to gpt-5-mini when available
-            messages=[
-                {"role": "system", "content": GAME_SUMMARY_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=150,
-            temperature=0.7
-        )
+    return user_prompt
+
+
+def _game_summary_request(user_prompt):
+    """Keyword arguments for the chat completion shared by the blocking and streaming summaries."""
+    return {
+        "model": GAME_SUMMARY_MODEL,
+        "messages": [
+            {"role": "system", "content": GAME_SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "max_tokens": 150,
+        "temperature": 0.7,
+    }
+
 
-        summary = response.choices[0].message.content.strip()
+def generate_game_summary(payload, game_data, probability_map, wp_threshold=0.975, use_cache=False):
+    """
+    Generate a concise game summary using OpenAI.
+    Handles both completed and in-progress games. With `use_cache`, a summary for the
+    exact same model and prompt is reused from espn_cache/ instead of calling the API again.
+    """
+    api_key = os.environ.get('OPENAI_API_KEY')
+    if not api_key:
+        return None
+
+    try:
+        user_prompt = build_game_summary_prompt(payload, game_data, probability_map, wp_threshold)
+
+        def request_summary():
+            # Only built on a cache miss; a cached summary needs neither the client nor the import.
+            from openai import OpenAI
+
+            client = OpenAI(api_key=api_key)
+            response = client.chat.completions.create(**_game_summary_request(user_prompt))
+            return response.choices[0].message.content.strip()
+
+        # The prompt carries the score, status and stats, so an identical prompt means nothing changed.
+        prompt_hash = hashlib.blake2b(
+            f"{GAME_SUMMARY_MODEL}|{GAME_SUMMARY_SYSTEM_PROMPT}|{user_prompt}".encode(), digest_size=16
+        ).hexdigest()
+        summary = cached_json(
+            f"summary:{prompt_hash}", request_summary, use_cache, ttl=ESPN_FINAL_CACHE_TTL_SECONDS
+        )
 
         # Clean up response
         if summary.startswith('"') and summary.endswith('"'):
@@ -468,8 +667,33 @@ Write a concise summary (~280 chars) explaining {summary_focus}."""
         return None
 
 
+def generate_game_summary_stream(payload, game_data, probability_map, wp_threshold=0.975):
+    """
+    Yield the game summary's text as OpenAI streams it, for interactive callers that want the
+    first words before the whole response. Yields nothing without OPENAI_API_KEY; unlike
+    generate_game_summary, the text is neither cached nor stripped of wrapping quotes.
+    """
+    api_key = os.environ.get('OPENAI_API_KEY')
+    if not api_key:
+        return
+
+    try:
+        from openai import OpenAI
+
+        client = OpenAI(api_key=api_key)
+        user_prompt = build_game_summary_prompt(payload, game_data, probability_map, wp_threshold)
+        for chunk in client.chat.completions.create(stream=True, **_game_summary_request(user_prompt)):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except Exception as e:
+        print(f"Warning: Could not stream AI summary: {e}")
+
+
 def process_game_stats(game_data, expanded=False, probability_map=None, pregame_probabilities=None, wp_threshold=0.975):
     """Wrapper that calls shared core and returns pandas DataFrame."""
+    # Deferred so importing this module for its helpers doesn't pay for pandas.
+    import pandas as pd
+
     rows, details = _process_game_stats(
         game_data,
         expanded=expanded,
@@ -494,17 +718,13 @@ def main():
         default=0.975,
         help="WP threshold for competitive plays (default: 0.975). Plays where either team's WP >= this value are excluded from stats.",
     )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the espn_cache/ directory and refetch from ESPN")
     args = parser.parse_args()
 
     try:
         print(f"Fetching data for Game ID: {args.game_id}...")
-        raw_data = get_game_data(args.game_id)
-        pregame_home_wp, pregame_away_wp = get_pregame_probabilities(args.game_id)
-        prob_map = {}
-        try:
-            prob_map = get_play_probabilities(args.game_id)
-        except Exception:
-            prob_map = {}
+        use_cache = not args.no_cache
+        raw_data, prob_map, (pregame_home_wp, pregame_away_wp) = fetch_game_inputs(args.game_id, use_cache)
         # Last play timestamp/lag (core feed) shown at the top
         last_core_play = None
         drives_prev = raw_data.get('drives', {}).get('previous', [])
@@ -635,7 +855,7 @@ def main():
             "game_status": game_status_label,
             "is_final": game_is_final,
         }
-        ai_summary = generate_game_summary(payload, raw_data, prob_map, args.wp_threshold)
+        ai_summary = generate_game_summary(payload, raw_data, prob_map, args.wp_threshold, use_cache=use_cache)
         payload["ai_summary"] = ai_summary
         payload["analysis"] = build_analysis_text(payload)
 
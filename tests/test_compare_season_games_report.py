@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 
 import pytest
 
@@ -216,6 +217,48 @@ def test_build_season_recon_updates_passed_espn_stats_cache(tmp_path, monkeypatc
     assert len(recon) == 1
     assert "123" in stats_cache
     assert stats_cache["123"]["meta"] == {"away": "AAA", "home": "BBB"}
+    assert recon[0].abbr_to_id == {"AAA": "1", "BBB": "2"}
+    assert recon[0].id_to_abbr == {"1": "AAA", "2": "BBB"}
+
+    # A malformed entry is repaired in place (same cache size) and still reported as written.
+    stats_cache["123"] = {"espn_stats": None}
+    written = set()
+    report.build_season_recon(
+        ["123"], source="cache", cache_dir=cache_dir, cache_write=False, espn_stats_cache=stats_cache,
+        espn_stats_written=written,
+    )
+    assert written == {"123"}
+    assert stats_cache["123"]["meta"] == {"away": "AAA", "home": "BBB"}
+
+    # A valid entry is reused without being rewritten.
+    written.clear()
+    report.build_season_recon(
+        ["123"], source="cache", cache_dir=cache_dir, cache_write=False, espn_stats_cache=stats_cache,
+        espn_stats_written=written,
+    )
+    assert written == set()
+
+
+def test_extract_espn_official_team_stats_keeps_last_duplicate_stat():
+    raw = {
+        "header": {"competitions": [{"competitors": [
+            {"homeAway": "away", "team": {"abbreviation": "AAA"}, "score": "7"},
+            {"homeAway": "home", "team": {"abbreviation": "BBB"}, "score": "10"},
+        ]}]},
+        "boxscore": {"teams": [{
+            "team": {"abbreviation": "AAA"},
+            "statistics": [
+                {"name": "totalYards", "displayValue": "200"},
+                {"name": "turnovers", "displayValue": "1"},
+                {"name": "totalPenaltiesYards", "displayValue": "3-30"},
+                {"name": "totalYards", "displayValue": "215"},
+            ],
+        }]},
+    }
+
+    stats, meta = report.extract_espn_official_team_stats(raw)
+    assert stats["AAA"] == {"Score": 7, "Total Yards": 215, "Turnovers": 1, "Penalty Yards": 30}
+    assert meta == {"away": "AAA", "home": "BBB"}
 
 
 def test_compute_aggregate_deltas_sums_and_percentages():
@@ -350,7 +393,10 @@ def test_main_write_recommendations_flag_writes_file(tmp_path, monkeypatch):
 
     fake_recon = _game("123", away_to=1, home_to=0, away_yd=7, home_yd=0)
 
-    def fake_build_season_recon(game_ids, *, source, cache_dir, cache_write, espn_stats_cache=None):
+    def fake_build_season_recon(
+        game_ids, *, source, cache_dir, cache_write, espn_stats_cache=None, cache_gzip=False, max_workers=8,
+        espn_stats_written=None,
+    ):
         return [fake_recon], []
 
     monkeypatch.setattr(report, "build_season_recon", fake_build_season_recon)
@@ -433,3 +479,152 @@ def test_main_ids_input_does_not_overwrite_default_out_ids(tmp_path, monkeypatch
     rc = report.main()
     assert rc == 0
     assert default_out_ids.read_text() == existing
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("J.Doe up the middle to NYG 40 for 5 yards (T.Tackle). FUMBLES (T.Tackle), RECOVERED by DAL.", 5),
+        ("J.Doe pass short left to X for 12 yards, then for 3 yards. FUMBLES, recovered by DAL.", 3),
+        ("J.Doe up the middle for no gain (T.Tackle). FUMBLES, RECOVERED by DAL.", 0),
+        ("J.Doe sacked at NYG 30 for loss of 7 yards (T.Tackle). FUMBLES, RECOVERED by DAL.", -7),
+        ("J.Doe sacked for loss of 7 yards, lateral for 2 yards. FUMBLES, RECOVERED by DAL.", 2),
+        ("J.Doe FUMBLES (Aborted), recovered by NYG for 4 yards.", None),
+        ("J.Doe up the middle for 5 yards.", None),
+        ("", None),
+    ],
+)
+def test_credited_yards_before_fumble(text, expected):
+    assert report._credited_yards_before_fumble(text) == expected
+
+
+def test_residual_from_rows_sums_kneels_and_fumble_credit():
+    drives = [
+        {
+            "team": {"id": "1"},
+            "plays": [
+                {"type": {"text": "Rush"}, "statYardage": -1, "text": "J.Doe kneels to NYG 30 for -1 yards."},
+                {
+                    "type": {"text": "Rush"},
+                    "statYardage": -3,
+                    "text": "J.Doe up the middle for 4 yards. FUMBLES, RECOVERED by DAL at NYG 27.",
+                },
+            ],
+        },
+        {"team": {"id": "2"}, "plays": [{"type": {"text": "Rush"}, "statYardage": -2, "text": "X kneels for -2 yards."}]},
+    ]
+    rows = report._flatten_plays({"drives": {"previous": drives}})
+    assert report._residual_from_rows(rows, "1") == (-1, 7)
+
+
+def test_json_helpers_fall_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(report, "orjson", None)
+    payload = {"drives": {"previous": [{"id": "1"}]}}
+    assert report._json_loads(report._json_dumps_bytes(payload)) == payload
+
+
+def test_load_raw_game_data_reads_gzip_cache(tmp_path):
+    payload = {"header": {"id": "123"}, "drives": {"previous": []}}
+    report._write_cached_payload(tmp_path, "123", payload, gzip_level=1)
+    assert (tmp_path / "123.json.gz").exists()
+    assert not (tmp_path / "123.json").exists()
+
+    raw, source = report.load_raw_game_data("123", source="cache", cache_dir=tmp_path)
+    assert source == "cache"
+    assert raw == payload
+
+
+def test_write_logic_recommendations_attributes_kneel_residual_from_cache(tmp_path):
+    game = _game("9", away_to=0, home_to=0, away_yd=2, home_yd=0)
+    raw = {
+        "boxscore": {
+            "teams": [
+                {"team": {"id": "1", "abbreviation": "AWY"}},
+                {"team": {"id": "2", "abbreviation": "HME"}},
+            ]
+        },
+        "drives": {
+            "previous": [
+                {
+                    "team": {"id": "1"},
+                    "plays": [
+                        {"type": {"text": "Rush"}, "statYardage": -2, "text": "QB kneels to AWY 28 for -2 yards."},
+                    ],
+                }
+            ]
+        },
+    }
+    cache_dir = tmp_path / "pbp_cache"
+    cache_dir.mkdir()
+    (cache_dir / "9.json").write_text(json.dumps(raw))
+
+    out_path = tmp_path / "recs.md"
+    report.write_logic_recommendations(out_path, [game], season=2025, cache_dir=cache_dir)
+    text = out_path.read_text()
+    assert "- Rows analyzed (with cache available): 1" in text
+    assert "- Rows exactly explained by kneel/spike exclusion: 1" in text
+    assert "- 9 AWY: YdsΔ +2 TOΔ +0 PenYdsΔ +0" in text
+
+
+def test_write_team_csv_writes_header_and_rows(tmp_path):
+    out = tmp_path / "team.csv"
+    report.write_team_csv(out, [_game("1", away_to=1, home_to=0, away_yd=-3, home_yd=0)])
+    rows = out.read_text().splitlines()
+    assert rows[0] == ",".join(report.TEAM_CSV_FIELDS)
+    assert rows[1] == "1,AWY,away,HME,0,-3,-3,0,1,1,0,0,0,test"
+    assert len(rows) == 3
+
+    empty = tmp_path / "empty.csv"
+    report.write_team_csv(empty, [])
+    assert empty.read_text().splitlines() == [",".join(report.TEAM_CSV_FIELDS)]
+
+
+def test_write_markdown_report_trims_trailing_whitespace(tmp_path):
+    out = tmp_path / "report.md"
+    game = _game("1", away_to=1, home_to=0, away_yd=0, home_yd=0)
+    report.write_markdown_report(out, [game], ["1: boom  \n\n"], season=2025)
+    text = out.read_text()
+    assert "### 1 AWY @ HME (TOΔ max 1, YdsΔ max 0, raw=cache)" in text
+    assert text.endswith("## Failures\n- 1: boom\n")
+
+
+def test_espn_stats_cache_round_trip(tmp_path):
+    path = tmp_path / "audits" / "stats.json"
+    assert report.load_espn_stats_cache(path) == {}
+
+    cache = {"123": {"espn_stats": {"AAA": {"Total Yards": 200}}, "meta": {"away": "AAA", "home": "BBB"}}}
+    report.save_espn_stats_cache(path, cache)
+    assert report.load_espn_stats_cache(path) == cache
+    assert not (tmp_path / "audits" / "stats.json.tmp").exists()
+
+    path.write_text("not json")
+    assert report.load_espn_stats_cache(path) == {}
+
+
+def test_build_season_recon_threaded_keeps_input_order(monkeypatch):
+    def fake_build_game_recon(game_id, **_kwargs):
+        if game_id == "2":
+            raise ValueError("boom")
+        return _game(game_id, away_to=0, home_to=0, away_yd=0, home_yd=0)
+
+    monkeypatch.setattr(report, "_build_game_recon", fake_build_game_recon)
+    recon, failures = report.build_season_recon(
+        ["3", "1", "2", "4"], source="network", cache_dir=report.Path("."), cache_write=False, max_workers=4
+    )
+    assert [g.game_id for g in recon] == ["3", "1", "4"]
+    assert failures == ["2: boom"]
+
+
+def test_build_season_recon_runs_cache_source_without_threads(monkeypatch):
+    threads = set()
+
+    def fake_build_game_recon(game_id, **_kwargs):
+        threads.add(threading.get_ident())
+        return _game(game_id, away_to=0, home_to=0, away_yd=0, home_yd=0)
+
+    monkeypatch.setattr(report, "_build_game_recon", fake_build_game_recon)
+    recon, failures = report.build_season_recon(
+        ["1", "2", "3"], source="cache", cache_dir=report.Path("."), cache_write=False, max_workers=4
+    )
+    assert [g.game_id for g in recon] == ["1", "2", "3"]
+    assert threads == {threading.get_ident()}
@@ -1,5 +1,8 @@
+import json
 import os
+import subprocess
 import sys
+from types import SimpleNamespace
 
 import pytest
 
@@ -22,8 +25,9 @@ def test_get_pregame_probabilities_from_winprobability(monkeypatch):
             self._payload = payload
             self.status_code = status
 
-        def json(self):
-            return self._payload
+        @property
+        def content(self):
+            return json.dumps(self._payload).encode()
 
         def raise_for_status(self):
             if self.status_code >= 400:
@@ -40,7 +44,7 @@ def test_get_pregame_probabilities_from_winprobability(monkeypatch):
             }
         )
 
-    monkeypatch.setattr(gc.requests, "get", fake_get)
+    monkeypatch.setattr(gc._SESSION, "get", fake_get)
     home_wp, away_wp = gc.get_pregame_probabilities("12345")
     assert home_wp == pytest.approx(0.7047)
     assert away_wp == pytest.approx(0.2953)
@@ -52,8 +56,9 @@ def test_get_pregame_probabilities_missing_predictor_returns_even(monkeypatch):
             self._payload = payload
             self.status_code = status
 
-        def json(self):
-            return self._payload
+        @property
+        def content(self):
+            return json.dumps(self._payload).encode()
 
         def raise_for_status(self):
             if self.status_code >= 400:
@@ -62,7 +67,7 @@ def test_get_pregame_probabilities_missing_predictor_returns_even(monkeypatch):
     def fake_get(url, headers=None, timeout=None):
         return FakeResponse({})
 
-    monkeypatch.setattr(gc.requests, "get", fake_get)
+    monkeypatch.setattr(gc._SESSION, "get", fake_get)
     assert gc.get_pregame_probabilities("abcde") == (0.5, 0.5)
 
 
@@ -769,7 +774,7 @@ def test_generate_game_summary_in_progress(monkeypatch):
             captured["request"] = kwargs
             return FakeResponse()
 
-    monkeypatch.setattr(gc, "OpenAI", FakeOpenAI)
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
 
     summary = gc.generate_game_summary(payload, game_data, probability_map, wp_threshold=0.975)
     assert summary == "Stub summary"
@@ -1060,3 +1065,238 @@ def test_non_offensive_points_details_show_scoring_play():
     non_off = details["2"]["Non-Offensive Points"]
     assert non_off[0]["points"] == 7
     assert "Pick-six" in non_off[0]["text"]
+
+
+def test_cached_json_reuses_disk_copy_until_bypassed(monkeypatch, tmp_path):
+    monkeypatch.setattr(gc, "ESPN_CACHE_DIR", str(tmp_path / "cache"))
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert gc.cached_json("game:1", fetch) == {"n": 1}
+    assert gc.cached_json("game:1", fetch) == {"n": 1}
+    assert len(calls) == 1
+
+    assert gc.cached_json("game:1", fetch, use_cache=False) == {"n": 2}
+
+    monkeypatch.setattr(gc, "ESPN_CACHE_TTL_SECONDS", 0)
+    assert gc.cached_json("game:1", fetch) == {"n": 3}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_get_game_data_decodes_raw_body(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(gc, "orjson", None)
+    elif gc.orjson is None:
+        pytest.skip("orjson not installed")
+
+    class FakeResponse:
+        content = b'{"gamepackageJSON": {"header": {"id": "1"}}}'
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(gc._SESSION, "get", lambda url, timeout=None: FakeResponse())
+    assert gc.get_game_data("1") == {"header": {"id": "1"}}
+
+
+def test_cached_json_ttl_can_depend_on_cached_game_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(gc, "ESPN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(gc, "ESPN_LIVE_CACHE_TTL_SECONDS", 0)
+
+    def game(completed):
+        return {"header": {"competitions": [{"status": {"type": {"completed": completed}}}]}}
+
+    fetched = []
+
+    def fetch_live():
+        fetched.append("live")
+        return game(False)
+
+    gc.cached_json("gamepackage:1", fetch_live, ttl=gc.game_cache_ttl)
+    gc.cached_json("gamepackage:1", fetch_live, ttl=gc.game_cache_ttl)
+    assert fetched == ["live", "live"]
+
+    gc.cached_json("gamepackage:2", lambda: game(True), ttl=gc.game_cache_ttl)
+    assert gc.cached_json("gamepackage:2", lambda: pytest.fail("final game refetched"), ttl=gc.game_cache_ttl) == game(True)
+
+
+def test_get_play_probabilities_merges_pages_in_order_until_a_failure(monkeypatch):
+    class FakeResponse:
+        def __init__(self, payload):
+            self._payload = payload
+
+        @property
+        def content(self):
+            return json.dumps(self._payload).encode()
+
+        def raise_for_status(self):
+            if self._payload is None:
+                raise gc.requests.HTTPError("error")
+
+    def item(pid, home):
+        return {"play": {"$ref": f"https://x/plays/{pid}?lang=en"}, "homeWinPercentage": home}
+
+    pages = {
+        1: {"pageCount": 4, "items": [item("1", 0.5), item("2", 0.6)]},
+        2: {"items": [item("2", 0.65), item("3", 0.7)]},
+        3: None,
+        4: {"items": [item("4", 0.9)]},
+    }
+
+    def fake_get(url, timeout=None):
+        return FakeResponse(pages[int(url.rsplit("=", 1)[1])])
+
+    monkeypatch.setattr(gc._SESSION, "get", fake_get)
+    prob_map = gc.get_play_probabilities("1")
+    assert list(prob_map) == ["1", "2", "3"]
+    assert prob_map["2"]["homeWinPercentage"] == 0.65
+
+    assert gc.get_play_probabilities("1", return_complete=True) == (prob_map, False)
+
+
+def test_generate_game_summary_reuses_cached_summary_for_same_prompt(monkeypatch, tmp_path):
+    monkeypatch.setattr(gc, "ESPN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    calls = []
+
+    class FakeOpenAI:
+        def __init__(self, api_key=None):
+            self.chat = self
+            self.completions = self
+
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            message = type("msg", (), {"content": f"Summary {len(calls)}"})()
+            return type("resp", (), {"choices": [type("choice", (), {"message": message})()]})()
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
+    payload = {"team_meta": [{"homeAway": "away", "abbr": "AWY"}, {"homeAway": "home", "abbr": "HOM"}]}
+
+    assert gc.generate_game_summary(payload, {}, {}, use_cache=True) == "Summary 1"
+    assert gc.generate_game_summary(payload, {}, {}, use_cache=True) == "Summary 1"
+    assert gc.generate_game_summary(payload, {}, {}) == "Summary 2"
+    assert len(calls) == 2
+
+
+def test_generate_game_summary_stream_yields_content_deltas(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    captured = {}
+
+    def chunk(content):
+        delta = type("delta", (), {"content": content})()
+        return type("chunk", (), {"choices": [type("choice", (), {"delta": delta})()]})()
+
+    class FakeOpenAI:
+        def __init__(self, api_key=None):
+            self.chat = self
+            self.completions = self
+
+        def create(self, **kwargs):
+            captured.update(kwargs)
+            return iter([chunk("HOM "), chunk(None), chunk("leads.")])
+
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
+    payload = {"team_meta": [{"homeAway": "away", "abbr": "AWY"}, {"homeAway": "home", "abbr": "HOM"}]}
+
+    assert list(gc.generate_game_summary_stream(payload, {}, {})) == ["HOM ", "leads."]
+    assert captured["stream"] is True
+    assert captured["model"] == gc.GAME_SUMMARY_MODEL
+
+
+def test_importing_game_compare_defers_heavy_imports():
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    code = "import sys, game_compare; print(sorted(m for m in ('numpy', 'pandas', 'openai') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_fetch_game_inputs_ties_wp_cache_to_game_state_at_fetch_time(monkeypatch, tmp_path):
+    monkeypatch.setattr(gc, "ESPN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(gc, "ESPN_LIVE_CACHE_TTL_SECONDS", 0)
+    completed = {"value": False}
+    calls = []
+
+    def get_game_data(game_id):
+        calls.append("game")
+        return {"header": {"competitions": [{"status": {"type": {"completed": completed["value"]}}}]}}
+
+    def get_pregame_probabilities(game_id, strict=False):
+        assert strict
+        calls.append("pregame")
+        return 0.6, 0.4
+
+    def get_play_probabilities(game_id, return_complete=False):
+        assert return_complete
+        calls.append("probabilities")
+        return {}, False
+
+    monkeypatch.setattr(gc, "get_game_data", get_game_data)
+    monkeypatch.setattr(gc, "get_pregame_probabilities", get_pregame_probabilities)
+    monkeypatch.setattr(gc, "get_play_probabilities", get_play_probabilities)
+
+    game_data, prob_map, pregame = gc.fetch_game_inputs("1")
+    assert prob_map == {}
+    assert tuple(pregame) == (0.6, 0.4)
+    assert game_data["header"]["competitions"][0]["status"]["type"]["completed"] is False
+
+    # A live game's cached pregame WP expires with it.
+    calls.clear()
+    gc.fetch_game_inputs("1")
+    assert sorted(calls) == ["game", "pregame", "probabilities"]
+
+    # Once final, the pregame WP cached mid-game is refetched rather than kept for the final
+    # lifetime; the feed fetched now is then cached along with the game.
+    completed["value"] = True
+    calls.clear()
+    gc.fetch_game_inputs("1")
+    assert sorted(calls) == ["game", "pregame", "probabilities"]
+    calls.clear()
+    gc.fetch_game_inputs("1")
+    assert calls == ["probabilities"]
+
+
+def test_fetch_game_inputs_does_not_keep_failed_wp_fetches(monkeypatch, tmp_path):
+    monkeypatch.setattr(gc, "ESPN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(gc, "ESPN_LIVE_CACHE_TTL_SECONDS", 0)
+    final_game = {"header": {"competitions": [{"status": {"type": {"completed": True}}}]}}
+    responses = {"summary": [None, {"winprobability": [{"homeWinPercentage": 0.7}]}]}
+    prob_pages = [
+        {"pageCount": 2, "items": [{"id": "9", "homeWinPercentage": 0.8}]},
+        None,
+        {"pageCount": 2, "items": [{"id": "9", "homeWinPercentage": 0.8}]},
+        {"items": [{"id": "10", "homeWinPercentage": 0.9}]},
+    ]
+
+    class FakeResponse:
+        def __init__(self, payload):
+            self._payload = payload
+
+        @property
+        def content(self):
+            return json.dumps(self._payload).encode()
+
+        def raise_for_status(self):
+            if self._payload is None:
+                raise gc.requests.HTTPError("503")
+
+    def fake_get(url, timeout=None):
+        if "summary" in url:
+            return FakeResponse(responses["summary"].pop(0))
+        return FakeResponse(prob_pages.pop(0))
+
+    monkeypatch.setattr(gc._SESSION, "get", fake_get)
+    monkeypatch.setattr(gc, "get_game_data", lambda game_id: final_game)
+
+    # A failed page keeps the pages already merged.
+    _, prob_map, pregame = gc.fetch_game_inputs("1")
+    assert list(prob_map) == ["9"]
+    assert tuple(pregame) == (0.5, 0.5)
+
+    # Neither the pregame fallback nor the partial feed is kept for the final-game lifetime,
+    # so the retry reaches ESPN and gets the full feeds.
+    _, prob_map, pregame = gc.fetch_game_inputs("1")
+    assert list(prob_map) == ["9", "10"]
+    assert tuple(pregame) == pytest.approx((0.7, 0.3))
@@ -302,6 +302,10 @@ class TestClassifyOffensePlay:
             assert is_off is True, f"Failed for pattern: {pattern}"
             assert is_run is True, f"Failed for pattern: {pattern}"
 
+    def test_precomputed_lowercase_strings_match(self):
+        play = {"text": "Scramble for 12 yards", "type": {"text": "Scramble"}}
+        assert classify_offense_play(play, "scramble for 12 yards", "scramble") == classify_offense_play(play)
+
     def test_sack_is_pass(self):
         play = {
             "text": "Sacked for -8 yards",
@@ -12,7 +12,7 @@ Example:
 import sys
 import requests
 
-from game_compare import get_game_data, process_game_stats
+from game_compare import _SESSION, get_game_data, process_game_stats
 
 
 def get_espn_team_stats(game_id):
@@ -23,7 +23,7 @@ def get_espn_team_stats(game_id):
     url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary?event={game_id}"
 
     try:
-        resp = requests.get(url, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         resp.raise_for_status()
         data = resp.json()
     except requests.RequestException as e: